@@ -1,9 +1,19 @@
 import json
+import atexit
+import copy
 import logging
 import os
 import time
 import re
+import threading
+import uuid
+import concurrent.futures
+from collections import OrderedDict
+import requests.adapters
 from flask import Flask, request, jsonify
+import google.auth
+from google.auth.transport.requests import AuthorizedSession
+from google.api_core.exceptions import NotFound
 from google.cloud import firestore
 from google.cloud import storage
 from openai import OpenAI
@@ -29,9 +39,26 @@ except Exception as e:
     logger.error(f"Firestore 초기화 실패: {e}")
     db = None
 
+# GCS 동시 조회 수 (/games 조회 스레드 풀 크기 = GCS 연결 풀 크기)
+GCS_LOOKUP_WORKERS = int(os.getenv("GCS_LOOKUP_WORKERS", "32"))
+
+# 동시 조회 수만큼 연결을 재사용하도록 연결 풀을 키운 GCS 클라이언트 (requests 기본 풀은 10개)
+# 인증 세션을 직접 만들어 생성자의 _http 인자로 넘긴다 (google-cloud-core 가 지원하는 인자지만 비공개 취급이라
+# 라이브러리 버전이 바뀌어 실패하면 기본 클라이언트로 돌아감, 이 경우 연결 풀만 기본 크기)
+def create_gcs_client():
+    try:
+        credentials, project = google.auth.default(scopes=storage.Client.SCOPE)
+        session = AuthorizedSession(credentials)
+        session.mount("https://", requests.adapters.HTTPAdapter(
+            pool_connections=GCS_LOOKUP_WORKERS, pool_maxsize=GCS_LOOKUP_WORKERS))
+        return storage.Client(project=project, credentials=credentials, _http=session)
+    except Exception as e:
+        logger.warning(f"GCS 연결 풀 설정 실패, 기본 클라이언트 사용: {e}")
+        return storage.Client()
+
 # GCS 클라이언트 초기화
 try:
-    gcs_client = storage.Client()
+    gcs_client = create_gcs_client()
     bucket_name = os.getenv("GCS_BUCKET_NAME", "rjcode")
     bucket = gcs_client.bucket(bucket_name)
     logger.info(f"GCS 클라이언트 초기화 완료, 버킷: {bucket_name}")
@@ -66,32 +93,156 @@ def get_gcs_path(platform, rj_code):
     prefix = number_part[:2] if len(number_part) >= 2 else number_part.zfill(2)
     return f"{platform}/{prefix}/{rj_code}.json"
 
-# GCS에서 캐시 불러오기
+def normalize_rj_code(identifier):
+    return (identifier or '').upper().replace('-', '').replace('_', '').strip()
+
+def is_failure_data(data):
+    return data.get("status") == "404" or bool(data.get("permanent_error"))
+
+# GCS 조회 결과 메모리 캐시 (프로세스 안의 모든 gunicorn 스레드가 공유)
+# 크기 상한을 넘으면 가장 오래 안 쓴 항목부터, TTL 이 지나면 다음 조회 때 버린다
+# 404 / 영구 오류 데이터는 곧 다른 인스턴스가 실제 데이터를 올릴 수 있으므로 짧은 negative_ttl 만 유지
+class MemoryCache:
+    def __init__(self, max_items, ttl, negative_ttl):
+        self.max_items = max_items
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.items = OrderedDict()  # key → (만료 시각, 데이터)
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key):
+        with self.lock:
+            entry = self.items.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, data = entry
+            if time.monotonic() > expires_at:
+                del self.items[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self.items.move_to_end(key)
+            self.hits += 1
+        # 호출하는 쪽에서 결과(중첩된 목록 포함)를 고쳐도 캐시 내용은 바뀌지 않도록 깊은 사본 반환
+        return copy.deepcopy(data)
+
+    def put(self, key, data):
+        if self.max_items <= 0:
+            return
+        ttl = self.negative_ttl if is_failure_data(data) else self.ttl
+        if ttl <= 0:
+            self.invalidate(key)
+            return
+        data = copy.deepcopy(data)
+        with self.lock:
+            self.items[key] = (time.monotonic() + ttl, data)
+            self.items.move_to_end(key)
+            while len(self.items) > self.max_items:
+                self.items.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key):
+        with self.lock:
+            self.items.pop(key, None)
+
+    def stats(self):
+        with self.lock:
+            total = self.hits + self.misses
+            return {
+                'size': len(self.items),
+                'max_items': self.max_items,
+                'ttl': self.ttl,
+                'negative_ttl': self.negative_ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'hit_rate': round(self.hits / total, 3) if total else 0.0
+            }
+
+data_cache = MemoryCache(
+    max_items=int(os.getenv("GCS_MEMORY_CACHE_SIZE", "5000")),
+    ttl=float(os.getenv("GCS_MEMORY_CACHE_TTL", "300")),
+    negative_ttl=float(os.getenv("GCS_MEMORY_CACHE_NEGATIVE_TTL", "30"))
+)
+
+# GCS에서 캐시 불러오기 (메모리 캐시에 있으면 GCS 요청 없음)
 def get_cached_data(platform, identifier):
     if not bucket:
         logger.warning("GCS 버킷이 초기화되지 않음")
         return None
-    rj_code = identifier.upper().replace('-', '').replace('_', '').strip()
+    rj_code = normalize_rj_code(identifier)
+    cached = data_cache.get((platform, rj_code))
+    if cached is not None:
+        logger.debug(f"[메모리 캐시] 조회 성공: {platform}:{rj_code}")
+        return cached
+
     blob_path = get_gcs_path(platform, rj_code)
     blob = bucket.blob(blob_path)
 
-    if blob.exists():
+    # exists() + download 두 번 왕복 대신 바로 다운로드, 없으면 NotFound → 캐시 없음
+    try:
         content = blob.download_as_text()
-        data = json.loads(content)
+    except NotFound:
+        return None
+    data = json.loads(content)
 
-        # ✅ 404 혹은 오류 상태면 바로 리턴
-        if data.get("status") == "404" or data.get("permanent_error"):
-            logger.info(f"[GCS 캐시] 404 확인: {platform}:{rj_code}")
-            return data
+    # ✅ 404 혹은 오류 상태면 바로 리턴
+    if data.get("status") == "404" or data.get("permanent_error"):
+        logger.info(f"[GCS 캐시] 404 확인: {platform}:{rj_code}")
+        data_cache.put((platform, rj_code), data)
+        return data
 
-        # ✅ 타임스탬프 없는 경우 무효
-        if not data.get("timestamp"):
-            logger.warning(f"[GCS 캐시] 타임스탬프 없음: {platform}:{rj_code}")
-            return None
+    # ✅ 타임스탬프 없는 경우 무효
+    if not data.get("timestamp"):
+        logger.warning(f"[GCS 캐시] 타임스탬프 없음: {platform}:{rj_code}")
+        return None
 
-        logger.info(f"[GCS 캐시] 조회 성공: {platform}:{rj_code}")
-        return data
-    return None
+    logger.info(f"[GCS 캐시] 조회 성공: {platform}:{rj_code}")
+    data_cache.put((platform, rj_code), data)
+    return data
+
+# /games 항목 조회용 스레드 풀 (모든 요청 스레드가 공유, GCS 동시 요청 수 상한)
+lookup_executor = concurrent.futures.ThreadPoolExecutor(max_workers=GCS_LOOKUP_WORKERS, thread_name_prefix="gcs-lookup")
+# /games 업로드 항목 저장용 스레드 풀 (GPT 번역 대기로 오래 걸리므로 조회 풀과 분리)
+save_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=int(os.getenv("GAMES_SAVE_WORKERS", "16")), thread_name_prefix="games-save")
+
+# 작업별 미완료 RJ 코드 (task_id → 캐시에 아직 없는 항목)
+TASK_TTL = 600
+# /progress long-poll 최대 대기 시간과 GCS 재확인 간격 (초), 대기 중에는 gunicorn 스레드 하나를 점유
+PROGRESS_MAX_WAIT = float(os.getenv("PROGRESS_MAX_WAIT", "10"))
+PROGRESS_POLL_SLICE = float(os.getenv("PROGRESS_POLL_SLICE", "1.5"))
+task_cond = threading.Condition()
+tasks = {}
+
+def register_task(task_id, pending_codes):
+    now = time.time()
+    with task_cond:
+        for old_id in [k for k, v in tasks.items() if now - v['created'] > TASK_TTL]:
+            tasks.pop(old_id, None)
+        tasks[task_id] = {
+            'codes': set(pending_codes),
+            'pending': set(pending_codes),
+            'total': len(set(pending_codes)),
+            'created': now
+        }
+        return tasks[task_id]
+
+def mark_resolved(rj_code):
+    with task_cond:
+        changed = False
+        for task in tasks.values():
+            if rj_code in task['pending']:
+                task['pending'].discard(rj_code)
+                changed = True
+        if changed:
+            task_cond.notify_all()
 
 # GCS에 캐시 저장
 def cache_data(platform, rj_code, data):
@@ -103,41 +254,180 @@ def cache_data(platform, rj_code, data):
         blob = bucket.blob(blob_path)
         blob.upload_from_string(json.dumps(data, ensure_ascii=False), content_type='application/json')
         logger.info(f"[GCS 캐시] 저장 완료: {blob_path}")
+        # 조회 규칙과 같게: 타임스탬프 없는 데이터는 메모리에 두지 않음
+        key = (platform, normalize_rj_code(rj_code))
+        if data.get("timestamp") or data.get("status") == "404" or data.get("permanent_error"):
+            data_cache.put(key, data)
+        else:
+            data_cache.invalidate(key)
+        mark_resolved(rj_code)
     except Exception as e:
+        data_cache.invalidate((platform, normalize_rj_code(rj_code)))
         logger.error(f"[GCS 캐시 오류] 저장 실패: {platform}/{rj_code}, 오류: {e}", exc_info=True)
 
-# 태그 캐시
-def get_cached_tag(tag_jp):
-    if not db:
-        return None
-    try:
-        safe_tag_id = normalize_tag_id(tag_jp)
-        doc_ref = db.collection('tags').document('jp_to_kr').collection('mappings').document(safe_tag_id)
-        doc = doc_ref.get()
-        if doc.exists:
-            return doc.to_dict()
-        return None
-    except Exception as e:
-        logger.error(f"태그 캐시 조회 오류: {tag_jp}: {e}")
-        return None
-
 def normalize_tag_id(tag_jp):
     # Firestore 문서 ID로 쓸 수 있도록 슬래시 제거 또는 대체
     return tag_jp.replace("/", "-")
 
+def tag_mappings_ref():
+    return db.collection('tags').document('jp_to_kr').collection('mappings')
+
+# 태그 변환 테이블: tags/jp_to_kr/mappings 전체를 메모리에 두고 주기적으로 다시 읽는다
+# (태그 하나 조회할 때마다 Firestore 를 읽지 않음, 컬렉션이 작아서 통째로 읽어도 부담 없음)
+class TagTable:
+    def __init__(self, refresh_interval):
+        self.refresh_interval = refresh_interval
+        self.mappings = {}  # 문서 ID(normalize_tag_id) → {'tag_jp', 'tag_kr', 'priority'}
+        self.local_updates = {}  # 새로 읽는 동안 이 프로세스에서 저장한 항목 (새 테이블에 덮어씀)
+        self.lock = threading.Lock()
+        self.loaded_at = None
+        self.thread = None
+
+    def refresh(self):
+        if not db:
+            return
+        with self.lock:
+            self.local_updates = {}
+        try:
+            loaded = {doc.id: doc.to_dict() for doc in tag_mappings_ref().stream()}
+        except Exception as e:
+            logger.error(f"태그 테이블 로드 오류: {e}")
+            return
+        with self.lock:
+            # 아직 Firestore 에 커밋되지 않은 매핑 + 읽는 동안 저장된 매핑은 유지
+            loaded.update(tag_writer.pending_items())
+            loaded.update(self.local_updates)
+            self.mappings = loaded
+            self.local_updates = {}
+            self.loaded_at = time.time()
+        logger.info(f"태그 테이블 로드 완료: {len(loaded)}개")
+
+    def start(self):
+        self.refresh()
+        if db and self.refresh_interval > 0:
+            self.thread = threading.Thread(target=self.refresh_loop, name="tag-table-refresh", daemon=True)
+            self.thread.start()
+
+    def refresh_loop(self):
+        while True:
+            time.sleep(self.refresh_interval)
+            self.refresh()
+
+    def get(self, tag_jp):
+        return self.mappings.get(normalize_tag_id(tag_jp))
+
+    def put(self, tag_id, mapping):
+        with self.lock:
+            self.mappings[tag_id] = mapping
+            self.local_updates[tag_id] = mapping
+
+    def stats(self):
+        return {'size': len(self.mappings), 'loaded_at': self.loaded_at, 'refresh_interval': self.refresh_interval}
+
+# 새 태그 매핑 Firestore 저장: 요청 스레드에서 바로 set 하지 않고 모아 두었다가
+# flush_window 초마다 (또는 batch_size 개가 모이면) WriteBatch 하나로 커밋
+class TagWriter:
+    BATCH_LIMIT = 500  # Firestore 배치 하나의 최대 쓰기 수
+
+    def __init__(self, flush_window, batch_size):
+        self.flush_window = flush_window
+        self.batch_size = max(1, min(batch_size, self.BATCH_LIMIT))
+        self.pending = {}  # 문서 ID → 매핑 (같은 태그는 마지막 값만)
+        self.cond = threading.Condition()
+        self.flush_lock = threading.Lock()
+        self.thread = None
+        self.written = 0
+        self.batches = 0
+        self.failures = 0
+
+    def start(self):
+        if db and self.thread is None:
+            self.thread = threading.Thread(target=self.flush_loop, name="tag-writer", daemon=True)
+            self.thread.start()
+
+    def add(self, tag_id, mapping):
+        with self.cond:
+            self.pending[tag_id] = mapping
+            self.cond.notify_all()
+
+    def pending_items(self):
+        with self.cond:
+            return dict(self.pending)
+
+    def flush_loop(self):
+        while True:
+            with self.cond:
+                self.cond.wait_for(lambda: self.pending)
+                # 창이 끝나거나 배치가 가득 찰 때까지 더 모은다
+                self.cond.wait_for(lambda: len(self.pending) >= self.batch_size, timeout=self.flush_window)
+            if not self.flush():
+                time.sleep(min(self.flush_window * 4, 5))
+
+    def flush(self):
+        """대기 중인 매핑을 최대 batch_size 개 커밋, 실패하면 False"""
+        if not db:
+            return True
+        with self.flush_lock:
+            with self.cond:
+                items = list(self.pending.items())[:self.batch_size]
+            if not items:
+                return True
+            try:
+                batch = db.batch()
+                for tag_id, mapping in items:
+                    batch.set(tag_mappings_ref().document(tag_id), mapping)
+                batch.commit()
+            except Exception as e:
+                # 대기열에 남겨 다음 창에서 다시 시도 (메모리 테이블에는 이미 반영돼 있음)
+                self.failures += 1
+                logger.error(f"태그 배치 저장 오류: {len(items)}개: {e}")
+                return False
+            with self.cond:
+                for tag_id, mapping in items:
+                    if self.pending.get(tag_id) is mapping:
+                        del self.pending[tag_id]
+            self.written += len(items)
+            self.batches += 1
+            logger.info(f"태그 배치 저장 완료: {len(items)}개")
+            return True
+
+    def flush_all(self):
+        """종료 시 남은 매핑 모두 저장"""
+        while self.pending_items():
+            if not self.flush():
+                break
+
+    def stats(self):
+        return {'pending': len(self.pending), 'written': self.written, 'batches': self.batches,
+                'failures': self.failures, 'flush_window': self.flush_window}
+
+tag_writer = TagWriter(
+    flush_window=float(os.getenv("TAG_FLUSH_WINDOW", "0.5")),
+    batch_size=int(os.getenv("TAG_FLUSH_BATCH", "500"))
+)
+tag_table = TagTable(refresh_interval=float(os.getenv("TAG_TABLE_REFRESH", "300")))
+tag_table.start()
+tag_writer.start()
+atexit.register(tag_writer.flush_all)
+
+# 태그 캐시 (메모리 테이블 조회, 네트워크 요청 없음)
+def get_cached_tag(tag_jp):
+    return tag_table.get(tag_jp)
+
 def cache_tag(tag_jp, tag_kr, priority):
     if not db:
         return
     try:
         safe_tag_id = normalize_tag_id(tag_jp)
         normalized_tag_kr = normalize_tag_id(tag_kr)  # 🔥 하이픈 등으로 정제
-        doc_ref = db.collection('tags').document('jp_to_kr').collection('mappings').document(safe_tag_id)
-        doc_ref.set({
+        mapping = {
             'tag_jp': tag_jp,        # 원본 그대로 저장
             'tag_kr': normalized_tag_kr,
             'priority': priority
-        })
-        logger.info(f"태그 캐시 저장: {tag_jp} → {normalized_tag_kr} (ID: {safe_tag_id})")
+        }
+        tag_table.put(safe_tag_id, mapping)
+        tag_writer.add(safe_tag_id, mapping)
+        logger.info(f"태그 캐시 저장 예약: {tag_jp} → {normalized_tag_kr} (ID: {safe_tag_id})")
     except Exception as e:
         logger.error(f"태그 캐시 저장 오류: {tag_jp}: {e}")
 
@@ -207,6 +497,191 @@ def translate_with_gpt_batch(tags, title_jp=None, batch_idx=""):
         logger.error(f"GPT 번역 오류: 배치 {batch_idx}: {e}")
         return tags, title_jp  # 번역 실패 시 원래 제목 유지
 
+# 여러 항목을 한 번의 GPT 호출로 번역 (항목 ID 를 키로 하는 JSON 응답)
+def translate_items_with_gpt(entries):
+    """entries: [{'id', 'tags', 'title'}] → {id: (번역된 태그 목록, 번역된 제목)} (응답에 없거나 형식이 틀린 항목은 빠짐)"""
+    payload = {
+        "items": [
+            {"id": e['id'], "tags": e['tags'], "title": e['title'] or ""}
+            for e in entries
+        ]
+    }
+    prompt = (
+        "당신은 일본어에서 한국어로 번역하는 전문 번역가입니다.\n"
+        "아래 JSON 의 각 항목(items)에 대해 태그들과 제목을 문맥에 맞게 한국어로 번역해주세요.\n"
+        "반드시 JSON 형식으로만 응답하며, 항목 id 를 키로 하는 아래 구조를 따라야 합니다.\n"
+        "태그 배열은 입력과 같은 개수, 같은 순서여야 합니다.\n"
+        "제목(title)이 비어 있거나 한국어나 영어인 경우 그대로 돌려주세요.\n\n"
+        "출력 형식 예시:\n"
+        "{\n"
+        "  \"items\": {\n"
+        "    \"1\": {\"tags\": [\"RPG\", \"액션\"], \"title\": \"소녀의 모험\"}\n"
+        "  }\n"
+        "}\n\n"
+        f"Input:\n{json.dumps(payload, ensure_ascii=False)}\n"
+        "Output:"
+    )
+    response = openai_client.chat.completions.create(
+        model="gpt-4o-mini",
+        messages=[
+            {"role": "system", "content": "You are a translator specializing in Japanese to Korean."},
+            {"role": "user", "content": prompt}
+        ],
+        response_format={"type": "json_object"},
+        max_tokens=min(16000, 200 * len(entries) + 100)
+    )
+    response_json = json.loads(response.choices[0].message.content)
+    translated = response_json.get('items') or {}
+
+    results = {}
+    for entry in entries:
+        result = translated.get(entry['id'])
+        if not isinstance(result, dict):
+            continue
+        tags = result.get('tags', entry['tags'])
+        if not isinstance(tags, list) or len(tags) != len(entry['tags']):
+            continue
+        title = entry['title']
+        if title:
+            title = result.get('title') or title
+        # 번역 실패 감지 (일본어로 돌아온 제목은 원본 유지)
+        if entry['title'] and title and needs_translation(title):
+            logger.warning(f"번역 실패: {entry['label']}: translated_title={title}은 여전히 일본어")
+            title = entry['title']
+        results[entry['id']] = ([str(t) for t in tags], title)
+    return results
+
+# 번역 마이크로 배치: 여러 항목 / 동시 요청의 (제목, 태그) 번역을 잠깐(window 초) 모아 한 번에 요청하고
+# 결과를 기다리는 호출 스레드에 나눠 준다. 배치 응답에서 빠진 항목만 항목별 번역으로 다시 시도
+class TranslationBatcher:
+    def __init__(self, window, max_items, max_concurrency, timeout):
+        self.window = window
+        self.timeout = timeout
+        self.max_items = max(1, max_items)
+        self.queue = []
+        self.cond = threading.Condition()
+        self.next_id = 0
+        self.thread = None
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="gpt-batch")
+        self.calls = 0
+        self.items = 0
+        self.fallbacks = 0
+
+    def translate(self, tags, title_jp=None, batch_idx=""):
+        """translate_with_gpt_batch 와 같은 결과 (번역된 태그 목록, 번역된 제목), 배치가 끝날 때까지 대기"""
+        if not tags and not title_jp:
+            return tags, title_jp
+        if not openai_client or self.max_items <= 1 or self.window <= 0:
+            return translate_with_gpt_batch(tags, title_jp, batch_idx=batch_idx)
+
+        with self.cond:
+            self.next_id += 1
+            entry = {
+                'id': str(self.next_id),
+                'label': batch_idx,
+                'tags': list(tags),
+                'title': title_jp,
+                'done': threading.Event(),
+                'failed': False,
+                'result': (tags, title_jp)
+            }
+            self.queue.append(entry)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.collect_loop, name="gpt-batcher", daemon=True)
+                self.thread.start()
+            self.cond.notify_all()
+
+        if not entry['done'].wait(self.timeout):
+            with self.cond:
+                if entry in self.queue:
+                    self.queue.remove(entry)
+            logger.warning(f"배치 번역 대기 시간 초과, 항목별 번역: {batch_idx}")
+            return translate_with_gpt_batch(tags, title_jp, batch_idx=batch_idx)
+        if entry['failed']:
+            return translate_with_gpt_batch(tags, title_jp, batch_idx=batch_idx)
+        return entry['result']
+
+    def fail_entries(self, entries):
+        # 배치로 처리하지 못한 항목: 기다리는 호출 스레드가 항목별 번역으로 처리
+        for entry in entries:
+            entry['failed'] = True
+            entry['done'].set()
+
+    def collect_loop(self):
+        try:
+            while True:
+                with self.cond:
+                    self.cond.wait_for(lambda: self.queue)
+                    # 창이 끝나거나 배치가 가득 찰 때까지 더 모은다
+                    self.cond.wait_for(lambda: len(self.queue) >= self.max_items, timeout=self.window)
+                    entries = self.queue[:self.max_items]
+                    del self.queue[:self.max_items]
+                try:
+                    self.executor.submit(self.run_batch, entries)
+                except Exception:
+                    self.fail_entries(entries)
+                    raise
+        except Exception as e:
+            logger.error(f"번역 배치 수집 스레드 종료: {e}", exc_info=True)
+        finally:
+            # 다음 translate() 호출이 스레드를 새로 띄우도록 하고, 대기 중인 항목은 모두 깨운다
+            with self.cond:
+                self.thread = None
+                queued, self.queue = self.queue, []
+            self.fail_entries(queued)
+
+    def run_batch(self, entries):
+        labels = ", ".join(e['label'] for e in entries)
+        fallback = set()  # 배치 응답에서 빠진 항목 id
+        try:
+            try:
+                results = translate_items_with_gpt(entries)
+                with self.cond:
+                    self.calls += 1
+            except Exception as e:
+                logger.error(f"GPT 배치 번역 오류: {len(entries)}개 ({labels}): {e}")
+                results = {}
+            with self.cond:
+                self.items += len(results)
+                self.fallbacks += len(entries) - len(results)
+            logger.info(f"배치 번역 완료: {len(results)}/{len(entries)}개 ({labels})")
+            for entry in entries:
+                if entry['id'] in results:
+                    entry['result'] = results[entry['id']]
+                    logger.info(f"번역 완료: {entry['label']}: tags={entry['result'][0]}, title={entry['result'][1]}")
+                else:
+                    fallback.add(entry['id'])
+        finally:
+            # 배치로 끝난 항목은 바로 깨우고, 빠진 항목은 항목별 번역을 따로 실행해 다른 대기자를 막지 않음
+            for entry in entries:
+                if entry['id'] in fallback:
+                    try:
+                        self.executor.submit(self.run_fallback, entry)
+                        continue
+                    except Exception as e:
+                        # 호출 스레드에서 직접 항목별 번역
+                        logger.error(f"항목별 번역 예약 실패: {entry['label']}: {e}")
+                        entry['failed'] = True
+                entry['done'].set()
+
+    def run_fallback(self, entry):
+        try:
+            entry['result'] = translate_with_gpt_batch(entry['tags'], entry['title'], batch_idx=entry['label'])
+        finally:
+            entry['done'].set()
+
+    def stats(self):
+        with self.cond:
+            return {'calls': self.calls, 'items': self.items, 'fallbacks': self.fallbacks,
+                    'queued': len(self.queue), 'window': self.window, 'max_items': self.max_items}
+
+translation_batcher = TranslationBatcher(
+    window=float(os.getenv("GPT_BATCH_WINDOW", "0.3")),
+    max_items=int(os.getenv("GPT_BATCH_SIZE", "20")),
+    max_concurrency=int(os.getenv("GPT_BATCH_CONCURRENCY", "4")),
+    timeout=float(os.getenv("GPT_BATCH_TIMEOUT", "90"))
+)
+
 # RJ 데이터 처리
 def process_rj_item(item):
     if 'error' in item:
@@ -282,7 +757,7 @@ def process_rj_item(item):
 
     if needs_translation(cleaned_title_jp) or tags_to_translate:
         logger.debug(f"번역 요청: {rj_code}: title_jp={cleaned_title_jp}, tags={tags_to_translate}")
-        translated_tags, translated_title = translate_with_gpt_batch(
+        translated_tags, translated_title = translation_batcher.translate(
             tags_to_translate,
             cleaned_title_jp if needs_translation(cleaned_title_jp) else None,
             batch_idx=rj_code
@@ -378,6 +853,58 @@ def process_item_with_safety(item):
     # 캐시 확인 요청일 경우 기존 로직 유지
     return None
 
+# /games 항목 정규화: 문자열(RJ 코드 / 제목)만 받은 경우 딕셔너리로 변환
+def normalize_game_item(item):
+    if isinstance(item, str):
+        # RJ 코드 패턴 확인
+        if re.match(r'^RJ\d{6,8}$', item, re.IGNORECASE):
+            item = {
+                "rj_code": item.upper(),
+                "platform": "rj"
+            }
+            logger.info(f"[문자열 변환] {item['rj_code']}")
+        else:
+            item = {
+                "title": item,
+                "platform": "steam"
+            }
+            logger.info(f"[문자열 변환] Steam 제목: {item['title']}")
+
+    # 이제 item은 확실히 딕셔너리 타입
+    logger.info(f"[항목 처리] {json.dumps(item, ensure_ascii=False)}")
+    return item
+
+# 캐시 저장 요청 (크롤링 성공 or 실패 후 업로드) 인지: process_item_with_safety 와 같은 조건
+def is_save_request(item):
+    return isinstance(item, dict) and bool(item.get("timestamp"))
+
+# 저장 요청 처리 (번역 대기 포함, save_executor 에서 실행): ('result', 데이터)
+def save_game_item(item):
+    processed = process_item_with_safety(item)
+    if processed:
+        return 'result', processed
+    return lookup_game_item(item)
+
+# 캐시 확인 요청 처리 (GCS 조회만, lookup_executor 에서 실행): ('result', 데이터) 또는 ('missing', RJ 코드)
+def lookup_game_item(item):
+    rj_code = item.get("rj_code") if isinstance(item, dict) else None
+    platform = item.get("platform", "rj") if isinstance(item, dict) else "rj"
+
+    # RJ 없는 경우 steam 처리
+    if not rj_code:
+        title = item.get("title", "untitled") if isinstance(item, dict) else str(item)
+        steam_fallback = process_steam_item(title)
+        logger.info(f"[Steam 모드] 제목={steam_fallback.get('title')}")
+        return 'result', steam_fallback
+
+    # 캐시 확인
+    cached = get_cached_data(platform, rj_code)
+    if cached and cached.get("timestamp"):
+        logger.info(f"[캐시 조회 성공] {platform}:{rj_code}")
+        return 'result', cached
+    logger.info(f"[캐시 조회 실패] {platform}:{rj_code}")
+    return 'missing', rj_code
+
 # 게임 데이터 처리 엔드포인트
 @app.route('/games', methods=['POST'])
 def process_games():
@@ -393,54 +920,25 @@ def process_games():
         if not items:
             return jsonify({'results': [], 'missing': [], 'task_id': 'none'})
 
+        # 조회는 GCS 조회 풀, 저장(번역 대기 포함)은 저장 풀에서 병렬로 실행하고 요청 순서대로 다시 모은다
+        # (번역이 느려도 다른 요청의 조회가 밀리지 않도록 풀을 나눔)
+        futures = []
         for item in items:
-            # 문자열(RJ 코드)만 받은 경우 딕셔너리로 변환
-            if isinstance(item, str):
-                # RJ 코드 패턴 확인
-                if re.match(r'^RJ\d{6,8}$', item, re.IGNORECASE):
-                    item = {
-                        "rj_code": item.upper(),
-                        "platform": "rj"
-                    }
-                    logger.info(f"[문자열 변환] {item['rj_code']}")
-                else:
-                    item = {
-                        "title": item,
-                        "platform": "steam"
-                    }
-                    logger.info(f"[문자열 변환] Steam 제목: {item['title']}")
-
-            # 이제 item은 확실히 딕셔너리 타입
-            logger.info(f"[항목 처리] {json.dumps(item, ensure_ascii=False)}")
-
-            # 수정: process_item_with_safety 함수로 처리
-            processed = process_item_with_safety(item)
-            if processed:
-                results.append(processed)
-                continue
-
-            # 캐시 확인 요청일 경우
-            rj_code = item.get("rj_code") if isinstance(item, dict) else None
-            platform = item.get("platform", "rj") if isinstance(item, dict) else "rj"
-
-            # RJ 없는 경우 steam 처리
-            if not rj_code:
-                title = item.get("title", "untitled") if isinstance(item, dict) else str(item)
-                steam_fallback = process_steam_item(title)
-                logger.info(f"[Steam 모드] 제목={steam_fallback.get('title')}")
-                results.append(steam_fallback)
-                continue
-
-            # 캐시 확인
-            cached = get_cached_data(platform, rj_code)
-            if cached and cached.get("timestamp"):
-                logger.info(f"[캐시 조회 성공] {platform}:{rj_code}")
-                results.append(cached)
+            item = normalize_game_item(item)
+            if is_save_request(item):
+                futures.append(save_executor.submit(save_game_item, item))
             else:
-                logger.info(f"[캐시 조회 실패] {platform}:{rj_code}")
-                missing.append(rj_code)
+                futures.append(lookup_executor.submit(lookup_game_item, item))
+        for future in futures:
+            kind, value = future.result()
+            if kind == 'result':
+                results.append(value)
+            else:
+                missing.append(value)
 
-        task_id = request.headers.get('X-Cloud-Trace-Context', 'manual_task')[:36]
+        task_id = uuid.uuid4().hex
+        if missing:
+            register_task(task_id, missing)
         logger.info(f"응답 반환: task_id={task_id}, 결과={len(results)}, 누락={len(missing)}")
         return jsonify({'results': results, 'missing': missing, 'task_id': task_id})
 
@@ -449,15 +947,83 @@ def process_games():
         return jsonify({'error': str(e)}), 500
 
 # 진행 상황 엔드포인트
-@app.route('/progress/<task_id>', methods=['GET'])
+# rj_codes 를 함께 보내면 다른 인스턴스에서 만든 task_id 라도 캐시 기준으로 확인하고 (rj_codes 없이 모르는 task_id 는 404),
+# wait(초)를 주면 모든 항목이 저장되거나 시간이 다 될 때까지 응답을 보류한다 (long-poll)
+@app.route('/progress/<task_id>', methods=['GET', 'POST'])
 def get_progress(task_id):
     try:
-        logger.info(f"진행 상황 요청: task_id={task_id}")
-        return jsonify({'completed': 0, 'total': 1, 'status': 'completed'})
+        if request.method == 'POST':
+            data = request.get_json(silent=True) or {}
+            rj_codes = data.get('rj_codes', [])
+            wait = data.get('wait', 0)
+        else:
+            rj_codes = [c for c in request.args.get('rj_codes', '').split(',') if c]
+            wait = request.args.get('wait', 0)
+        wait = max(0.0, min(float(wait or 0), PROGRESS_MAX_WAIT))
+        logger.info(f"진행 상황 요청: task_id={task_id}, 항목={len(rj_codes)}, wait={wait}")
+
+        with task_cond:
+            task = tasks.get(task_id)
+
+        if task is None:
+            if not rj_codes:
+                return jsonify({'error': f'알 수 없는 task_id: {task_id}'}), 404
+            # 다른 인스턴스에서 만든 task_id (또는 'none'): 새로 등록하지 않고 이 요청 안에서만 캐시 기준으로 확인
+            task = {'codes': set(), 'pending': set(), 'total': 0}
+
+        def resolve(rj):
+            mark_resolved(rj)
+            with task_cond:
+                task['pending'].discard(rj)
+
+        # 이 작업에서 처음 보는 코드는 캐시 기준으로 완료 여부 판단 (GCS 조회는 조회 풀에서 한 번에)
+        unknown = [rj for rj in dict.fromkeys(rj_codes) if rj not in task['codes']]
+        if unknown:
+            with task_cond:
+                task['codes'].update(unknown)
+                task['pending'].update(unknown)
+                task['total'] = len(task['codes'])
+            for rj, cached in zip(unknown, lookup_executor.map(lambda rj: get_cached_data('rj', rj), unknown)):
+                if cached:
+                    resolve(rj)
+
+        # 업로드가 다른 인스턴스에 저장될 수도 있으므로 짧게 나눠 기다리며 남은 코드를 GCS 에서 다시 확인
+        deadline = time.monotonic() + wait
+        with task_cond:
+            wanted = set(rj_codes) if rj_codes else set(task['pending'])
+        while True:
+            with task_cond:
+                remaining = deadline - time.monotonic()
+                task_cond.wait_for(lambda: not (task['pending'] & wanted),
+                                   timeout=max(0.0, min(PROGRESS_POLL_SLICE, remaining)))
+                still_pending = task['pending'] & wanted
+            if not still_pending or time.monotonic() >= deadline:
+                break
+            still_pending = list(still_pending)
+            for rj, cached in zip(still_pending, lookup_executor.map(lambda rj: get_cached_data('rj', rj), still_pending)):
+                if cached:
+                    resolve(rj)
+
+        with task_cond:
+            pending = sorted(task['pending'] & wanted)
+            total = len(wanted) if rj_codes else task['total']
+
+        status = 'completed' if not pending else 'pending'
+        return jsonify({'completed': total - len(pending), 'total': total, 'status': status, 'pending': pending})
     except Exception as e:
         logger.error(f"진행 상황 조회 오류: task_id={task_id}: {e}")
         return jsonify({'error': str(e)}), 500
 
+# 메모리 캐시 통계 (적중/실패/제거 횟수)
+@app.route('/cache-stats', methods=['GET'])
+def cache_stats():
+    return jsonify({
+        'data_cache': data_cache.stats(),
+        'tag_table': tag_table.stats(),
+        'tag_writer': tag_writer.stats(),
+        'translation_batcher': translation_batcher.stats()
+    })
+
 @app.route("/sync-tags", methods=["POST"])
 def sync_tags_to_games():
     try:
@@ -617,7 +1183,7 @@ def process_and_save_rj_item(item):
             priorities.append(10)
 
     # 번역
-    translated_tags, translated_title = translate_with_gpt_batch(
+    translated_tags, translated_title = translation_batcher.translate(
         tags_to_translate, cleaned_title if needs_translation(cleaned_title) else None, batch_idx=rj_code
     )
 
@@ -0,0 +1,105 @@
+import os
+import re
+import time
+import argparse
+import tracemalloc
+import multiprocessing
+from dlsite_parser import parse_with_lxml, parse_with_bs4, read_product_page, lxml
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# DLsite 상품 페이지 파서 벤치마크 (기존 BeautifulSoup 경로 vs lxml)
+# 사용 예: python bench_parser.py fixtures/dlsite_sample.html --pad 300 -n 50
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "dlsite_sample.html")
+PARSERS = {
+    'bs4': parse_with_bs4,
+    'lxml': parse_with_lxml,
+}
+
+
+def load_fixture(path, pad):
+    with open(path, 'r', encoding='utf-8') as f:
+        html = f.read()
+    # 실제 상품 페이지처럼 리뷰 블록을 반복해서 크기를 키운다
+    match = re.search(r'<!-- REVIEWS -->(.*?)<!-- /REVIEWS -->', html, re.S)
+    if match and pad > 1:
+        html = html.replace(match.group(1), match.group(1) * pad)
+    return html
+
+
+class _FixtureResponse:
+    """read_product_page 측정용: HTML 을 네트워크 응답처럼 조각 단위로 흘려준다"""
+    encoding = 'utf-8'
+
+    def __init__(self, body):
+        self.body = body
+
+    def iter_content(self, chunk_size=16384):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start:start + chunk_size]
+
+
+def run_one(name, html, iterations, queue):
+    parser = PARSERS[name]
+    parser(html)  # 워밍업
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        parser(html)
+    elapsed = (time.perf_counter() - start) / iterations
+
+    tracemalloc.start()
+    parser(html)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # lxml 트리는 C 메모리라 tracemalloc 에 잡히지 않으므로 최대 RSS 도 함께 기록
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None
+    queue.put((name, elapsed, peak, max_rss))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark DLsite page parsers")
+    parser.add_argument("fixture", nargs="?", default=FIXTURE, help="HTML fixture path")
+    parser.add_argument("--pad", type=int, default=300, help="Repeat the review block N times")
+    parser.add_argument("-n", "--iterations", type=int, default=50, help="Parses per parser")
+    args = parser.parse_args()
+
+    html = load_fixture(args.fixture, args.pad)
+    print(f"fixture: {args.fixture} ({len(html.encode('utf-8')) / 1024:.1f} KB)")
+
+    names = ['bs4'] + (['lxml'] if lxml is not None else [])
+    if lxml is None:
+        print("lxml 미설치: bs4 경로만 측정합니다.")
+
+    # 파서마다 새 프로세스에서 실행해 최대 RSS 가 서로 섞이지 않게 한다
+    queue = multiprocessing.Queue()
+    for name in names:
+        proc = multiprocessing.Process(target=run_one, args=(name, html, args.iterations, queue))
+        proc.start()
+        proc.join()
+        name, elapsed, peak, max_rss = queue.get()
+        rss = f", max RSS {max_rss / 1024:.1f} MB" if max_rss else ""
+        print(f"{name:>5}: {elapsed * 1000:8.2f} ms/page, python peak {peak / 1024:.1f} KB{rss}")
+
+    body = html.encode('utf-8')
+    streamed, size = read_product_page(_FixtureResponse(body))
+    print(f"stream: {size / 1024:.1f} KB / {len(body) / 1024:.1f} KB 읽음 ({size / len(body) * 100:.0f}%)")
+    if streamed is None or parse_with_bs4(streamed) != parse_with_bs4(html):
+        print("stream 결과 비교: 불일치")
+    else:
+        print("stream 결과 비교: 일치")
+
+    expected = parse_with_bs4(html)
+    for name in names[1:]:
+        result = PARSERS[name](html)
+        status = "일치" if result == expected else f"불일치: {result} != {expected}"
+        print(f"{name} 결과 비교: {status}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+import re
+import codecs
+import logging
+from urllib.parse import urljoin
+
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+# DLsite 상품 페이지에서 필요한 항목만 추출하는 공용 파서
+# lxml 이 있으면 XPath 로 필요한 노드만 찾고, 없으면 기존 BeautifulSoup 경로 사용
+
+_CLASS = "contains(concat(' ', normalize-space(@class), ' '), ' {} ')"
+
+XPATH_TITLE = '//*[@id="work_name"]'
+XPATH_OG_TITLE = '//meta[@property="og:title"]/@content'
+XPATH_TAGS = f'//div[{_CLASS.format("main_genre")}]//a'
+XPATH_GENRE_ROW = '//th[contains(., "ジャンル")]/following-sibling::td[1]//a'
+XPATH_GENRE_LINKS = '//a[contains(@href, "/maniax/genre")]'
+XPATH_DATE = '//th[contains(., "販売日")]/following-sibling::*[1][self::td]//a'
+XPATH_OG_IMAGE = '//meta[@property="og:image"]/@content'
+XPATH_THUMB_IMG = f'//img[{_CLASS.format("work_thumb")}]/@src'
+XPATH_MAKER = f'//span[{_CLASS.format("maker_name")}]'
+
+
+def _texts(nodes):
+    return [t for t in (n.text_content().strip() for n in nodes) if t]
+
+
+def _absolute(thumbnail_url, url):
+    if thumbnail_url and not thumbnail_url.startswith('http'):
+        return urljoin(url, thumbnail_url)
+    return thumbnail_url or ''
+
+
+def parse_with_lxml(html, url=''):
+    doc = lxml.html.document_fromstring(html)
+
+    title_nodes = doc.xpath(XPATH_TITLE)
+    og_title = doc.xpath(XPATH_OG_TITLE)
+
+    tags = _texts(doc.xpath(XPATH_TAGS))
+    if not tags:
+        tags = _texts(doc.xpath(XPATH_GENRE_ROW))
+    if not tags:
+        tags = _texts(doc.xpath(XPATH_GENRE_LINKS))
+
+    date_nodes = doc.xpath(XPATH_DATE)
+    thumb = doc.xpath(XPATH_OG_IMAGE) or doc.xpath(XPATH_THUMB_IMG)
+
+    maker = ''
+    maker_nodes = doc.xpath(XPATH_MAKER)
+    if maker_nodes:
+        links = maker_nodes[0].xpath('.//a')
+        maker = (links[0] if links else maker_nodes[0]).text_content().strip()
+
+    return {
+        'title': title_nodes[0].text_content().strip() if title_nodes else '',
+        'og_title': og_title[0].strip() if og_title else '',
+        'tags': tags,
+        'release_date': date_nodes[0].text_content().strip() if date_nodes else '',
+        'thumbnail_url': _absolute(thumb[0] if thumb else '', url),
+        'maker': maker
+    }
+
+
+def parse_with_bs4(html, url=''):
+    """기존 BeautifulSoup(html.parser) 경로 (lxml 미설치 시 폴백, 벤치마크 비교용)"""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, 'html.parser')
+    title_elem = soup.select_one('#work_name')
+    og_title = soup.find('meta', property='og:title')
+
+    tags = [a.text.strip() for a in soup.select('div.main_genre a') if a.text.strip()]
+    if not tags:
+        genre_th = soup.find('th', string=re.compile(r'ジャンル'))
+        if genre_th:
+            genre_td = genre_th.find_next_sibling('td')
+            if genre_td:
+                tags = [a.text.strip() for a in genre_td.select('a') if a.text.strip()]
+    if not tags:
+        links = soup.find_all('a', href=lambda x: x and '/maniax/genre' in x)
+        tags = [a.text.strip() for a in links if a.text.strip()]
+
+    date_elem = soup.select_one('th:-soup-contains("販売日") + td a')
+    thumb_elem = soup.select_one('meta[property="og:image"]') or soup.select_one('img.work_thumb')
+    maker_elem = soup.select_one('span.maker_name a') or soup.select_one('span.maker_name')
+
+    thumbnail_url = ''
+    if thumb_elem:
+        thumbnail_url = thumb_elem.get('content') or thumb_elem.get('src')
+
+    return {
+        'title': title_elem.text.strip() if title_elem else '',
+        'og_title': og_title['content'].strip() if og_title and og_title.get('content') else '',
+        'tags': tags,
+        'release_date': date_elem.text.strip() if date_elem else '',
+        'thumbnail_url': _absolute(thumbnail_url, url),
+        'maker': maker_elem.text.strip() if maker_elem else ''
+    }
+
+
+def parse_dlsite_html(html, url=''):
+    """상품 페이지 HTML → title / og_title / tags / release_date / thumbnail_url / maker"""
+    if lxml is not None:
+        try:
+            return parse_with_lxml(html, url)
+        except Exception as e:
+            logging.warning(f"[parser] lxml 파싱 실패, BeautifulSoup 으로 재시도: {e}")
+    return parse_with_bs4(html, url)
+
+
+# 스트리밍 다운로드: 메타데이터 블록(제목/장르/제작자/판매일/og:image)을 다 읽으면 중단
+REQUIRED_MARKERS = ('id="work_name"', 'og:image', 'maker_name')
+OUTLINE_MARKER = 'id="work_outline"'
+
+
+def read_product_page(response, chunk_size=16384, max_bytes=8 * 1024 * 1024):
+    """응답 본문을 조각 단위로 읽어 (html, 읽은 바이트 수) 반환, 성인 인증 페이지면 html=None"""
+    decoder = codecs.getincrementaldecoder(response.encoding or 'utf-8')(errors='replace')
+    parts = []
+    size = 0
+    tail = ''
+    seen = set()
+    in_outline = False
+    complete = False
+
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        if not chunk:
+            continue
+        size += len(chunk)
+        text = decoder.decode(chunk)
+        parts.append(text)
+
+        # 조각 경계에 걸친 표식도 찾도록 이전 조각 끝부분을 붙여서 검사
+        window = tail + text
+        tail = window[-64:]
+
+        if 'adult_check' in window.lower():
+            return None, size
+
+        for marker in REQUIRED_MARKERS:
+            if marker in window:
+                seen.add(marker)
+
+        pos = window.find(OUTLINE_MARKER)
+        if pos >= 0:
+            in_outline = True
+            window = window[pos:]
+        if in_outline and '</table>' in window:
+            complete = True
+
+        if complete and len(seen) == len(REQUIRED_MARKERS):
+            logging.debug(f"[parser] 메타데이터 블록 수신 완료, {size} bytes 에서 중단")
+            break
+        if size >= max_bytes:
+            logging.warning(f"[parser] 최대 크기 {max_bytes} bytes 도달, 읽기 중단")
+            break
+
+    parts.append(decoder.decode(b'', final=True))
+    return ''.join(parts), size
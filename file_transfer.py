@@ -0,0 +1,127 @@
+import os
+import errno
+import shutil
+import hashlib
+import logging
+
+# 파일 이동: 같은 파일시스템이면 rename, 다른 장치면 커널 안에서 복사(copy_file_range / sendfile) 후 검증하고 원본 삭제
+# 수 GB 압축 파일을 파이썬 read/write 루프로 옮기지 않기 위함
+
+CHUNK = 64 * 1024 * 1024
+SAMPLE_SIZE = 1024 * 1024
+
+
+def _existing_parent(path):
+    while path and not os.path.exists(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            break
+        path = parent
+    return path
+
+
+def is_cross_device(src, dst):
+    try:
+        return os.stat(src).st_dev != os.stat(_existing_parent(os.path.dirname(dst))).st_dev
+    except OSError:
+        return False
+
+
+def _copy_range(src_fd, dst_fd, size):
+    offset = 0
+    while offset < size:
+        copied = os.copy_file_range(src_fd, dst_fd, min(CHUNK, size - offset))
+        if copied == 0:
+            break
+        offset += copied
+    return offset
+
+
+def _copy_sendfile(src_fd, dst_fd, size):
+    offset = 0
+    while offset < size:
+        sent = os.sendfile(dst_fd, src_fd, offset, min(CHUNK, size - offset))
+        if sent == 0:
+            break
+        offset += sent
+    return offset
+
+
+def copy_file_fast(src, dst):
+    """src → dst 복사, 사용한 방법 이름 반환 (copy_file_range → sendfile → shutil 순으로 시도)"""
+    size = os.path.getsize(src)
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+        for name, copier in (("copy_file_range", getattr(os, 'copy_file_range', None) and _copy_range),
+                             ("sendfile", getattr(os, 'sendfile', None) and _copy_sendfile)):
+            if not copier:
+                continue
+            try:
+                if copier(src_fd, dst_fd, size) == size:
+                    os.fsync(dst_fd)
+                    return name
+            except OSError as e:
+                # 파일시스템/커널이 지원하지 않으면 다음 방법으로 (처음부터 다시)
+                if e.errno not in (errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EBADF):
+                    raise
+                logging.debug(f"[move] {name} 사용 불가 ({e}), 다른 방법으로 복사")
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+    # Windows / macOS (두 시스템 콜이 없음): 경로를 넘겨 shutil.copy2 가 OS 복사 경로를 쓰게 함
+    # (Windows 는 Python 3.12+ 에서 CopyFile2, 그 전에는 readinto 큰 버퍼 복사 / macOS 는 fcopyfile)
+    shutil.copy2(src, dst)
+    with open(dst, 'rb+') as fdst:
+        os.fsync(fdst.fileno())
+    return "copy2"
+
+
+def _digest(path, full):
+    h = hashlib.blake2b(digest_size=16)
+    size = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        if full or size <= SAMPLE_SIZE * 3:
+            for block in iter(lambda: f.read(CHUNK), b''):
+                h.update(block)
+        else:
+            # 앞 / 가운데 / 끝 1MB 씩만 비교 (전체 비교는 GAMESORTER_VERIFY=full)
+            for offset in (0, size // 2, size - SAMPLE_SIZE):
+                f.seek(offset)
+                h.update(f.read(SAMPLE_SIZE))
+    return h.hexdigest()
+
+
+def verify_copy(src, dst, full=None):
+    full = os.getenv("GAMESORTER_VERIFY", "sample") == "full" if full is None else full
+    if os.path.getsize(src) != os.path.getsize(dst):
+        return False
+    return _digest(src, full) == _digest(dst, full)
+
+
+def move_file(src, dst):
+    """src 를 dst 로 이동 (dst 가 이미 있으면 FileExistsError), 사용한 방법 이름 반환"""
+    if os.path.exists(dst):
+        raise FileExistsError(f"대상 파일이 이미 있음: {dst}")
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    try:
+        os.rename(src, dst)
+        return "rename"
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+
+    part = dst + ".part"
+    try:
+        method = copy_file_fast(src, part)
+        shutil.copystat(src, part)
+        if not verify_copy(src, part):
+            raise IOError(f"복사 검증 실패: {src} → {dst}")
+        os.rename(part, dst)
+    except BaseException:
+        try:
+            os.remove(part)
+        except OSError:
+            pass
+        raise
+    os.remove(src)
+    return method
@@ -0,0 +1,111 @@
+import os
+import logging
+from PySide6.QtCore import QObject, QFileSystemWatcher, QTimer, Signal
+from library_scanner import scan_directory, walk_directories
+
+
+# 라이브러리 폴더 감시: 디렉터리 변경 알림(inotify / ReadDirectoryChangesW)을 모아서(debounce)
+# 바뀐 디렉터리만 다시 읽고, 크기가 더 이상 변하지 않는 새 압축 파일만 new_files 로 알린다
+class FolderWatcher(QObject):
+    new_files = Signal(list)
+
+    def __init__(self, debounce_ms=1500, parent=None):
+        super().__init__(parent)
+        self.root = None
+        self.known_paths = set()
+        self.dirty_dirs = set()
+        self.candidates = {}  # 다운로드 중일 수 있는 파일: normcase(path) → (실제 경로, 마지막으로 본 크기)
+
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.directoryChanged.connect(self.on_directory_changed)
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(debounce_ms)
+        self.timer.timeout.connect(self.process_changes)
+
+    def start(self, root, known_paths):
+        self.stop()
+        self.root = root
+        self.known_paths = {os.path.normcase(p) for p in known_paths}
+        dirs = list(walk_directories(root))
+        if dirs:
+            self.watcher.addPaths(dirs)
+        logging.info(f"[watch] 감시 시작: {root} ({len(dirs)}개 디렉터리)")
+
+    def stop(self):
+        self.timer.stop()
+        watched = self.watcher.directories()
+        if watched:
+            self.watcher.removePaths(watched)
+        self.dirty_dirs.clear()
+        self.candidates.clear()
+        self.root = None
+
+    def is_active(self):
+        return self.root is not None
+
+    def forget(self, path):
+        self.known_paths.discard(os.path.normcase(path))
+
+    def remember(self, path):
+        self.known_paths.add(os.path.normcase(path))
+
+    def on_directory_changed(self, path):
+        self.dirty_dirs.add(path)
+        self.timer.start()
+
+    def process_changes(self):
+        if not self.root:
+            return
+        dirty, self.dirty_dirs = self.dirty_dirs, set()
+        # 지난번에 크기가 변하던 파일이 있는 디렉터리도 다시 확인 (Windows 에서 소문자가 된 키 대신 실제 경로)
+        dirty.update(os.path.dirname(path) for path, _ in self.candidates.values())
+
+        ready = []
+        seen = set()  # 이번에 다시 읽은 디렉터리에서 본 파일 (normcase)
+        for path in dirty:
+            if not os.path.isdir(path):
+                continue
+            files, subdirs = scan_directory(path)
+
+            # 새로 생긴 하위 디렉터리는 감시 목록에 추가하고 바로 검사
+            watched = set(self.watcher.directories())
+            for subdir in subdirs:
+                if subdir not in watched:
+                    new_dirs = list(walk_directories(subdir))
+                    self.watcher.addPaths(new_dirs)
+                    for new_dir in new_dirs:
+                        ready.extend(self.collect_ready(scan_directory(new_dir)[0], seen))
+
+            ready.extend(self.collect_ready(files, seen))
+
+        # 다시 읽었는데 보이지 않는 후보(삭제됨 / 디렉터리가 사라짐 / stat 실패)는 버려서 타이머가 멈추게 함
+        # (후보의 디렉터리는 모두 dirty 에 포함돼 이번에 다시 읽었음)
+        for key in [k for k in self.candidates if k not in seen]:
+            del self.candidates[key]
+
+        if ready:
+            for entry in ready:
+                entry['rel_path'] = os.path.relpath(entry['path'], self.root)
+            logging.info(f"[watch] 새 파일 {len(ready)}개")
+            self.new_files.emit(ready)
+
+        if self.candidates:
+            self.timer.start()
+
+    def collect_ready(self, files, seen):
+        ready = []
+        for entry in files:
+            key = os.path.normcase(entry['path'])
+            seen.add(key)
+            if key in self.known_paths:
+                continue
+            last_size = self.candidates.get(key, (None, None))[1]
+            if last_size is not None and last_size == entry['size']:
+                self.candidates.pop(key, None)
+                self.known_paths.add(key)
+                ready.append(entry)
+            else:
+                self.candidates[key] = (entry['path'], entry['size'])
+        return ready
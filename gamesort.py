@@ -4,7 +4,7 @@ import re
 import json
 from pathlib import Path
 import requests
-from bs4 import BeautifulSoup
+from dlsite_parser import parse_dlsite_html
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QPushButton, QFileDialog, QVBoxLayout,
     QTableWidget, QTableWidgetItem, QCheckBox, QHBoxLayout, QLabel, QHeaderView,
@@ -453,19 +453,10 @@ class MainWindow(QMainWindow):
                     time.sleep(2 ** attempt)
                     continue
 
-                soup = BeautifulSoup(response.text, 'html.parser')
-                title_tag = soup.find('h1', id='work_name') or soup.find('h1', itemprop='name')
-                title = title_tag.text.strip() if title_tag else soup.find('meta', property='og:title')['content'].strip() if soup.find('meta', property='og:title') else rj_code
-
-                tags = []
-                genre_elements = soup.find_all('a', href=lambda x: x and '/maniax/genre' in x)
-                for elem in genre_elements:
-                    tag = elem.text.strip()
-                    if tag:
-                        tags.append(tag)
-
-                maker = soup.find('span', class_='maker_name')
-                maker = maker.text.strip() if maker else ""
+                parsed = parse_dlsite_html(response.text, url)
+                title = parsed['title'] or parsed['og_title'] or rj_code
+                tags = parsed['tags']
+                maker = parsed['maker']
 
                 engine = rj_code
                 if any(tag.lower() in ['rpg', 'ロールプレイング', '쯔꾸르'] for tag in tags):
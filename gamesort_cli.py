@@ -0,0 +1,231 @@
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import threading
+import multiprocessing
+import concurrent.futures
+from dotenv import load_dotenv
+from pipeline import GameFetcher, build_file_result, build_result_index, lookup_result, apply_match
+from dlsite_parser import parse_dlsite_html
+from library_scanner import scan_library
+from library_snapshot import load_snapshot, save_snapshot, diff_snapshot
+from rename_engine import RenameJournal, build_rename_plan, execute_plan, is_temp_path
+from organizer import ORGANIZE_MODES, build_organize_requests
+
+# GUI(PySide6) 없이 스캔 → 서버 조회 → 크롤링 → 이름 제안 → 이름 변경(기본은 dry-run) 실행
+# 진행 상황은 stdout 에 한 줄에 하나씩 JSON 으로 출력 (NAS 야간 작업 / 다른 도구 연동용)
+# 사용 예: python gamesort_cli.py /volume1/games --apply
+#          python gamesort_cli.py /volume1/games --organize maker --target /volume2/sorted --apply
+
+DEFAULT_SERVER_URL = "https://gamesorter-28083845590.us-central1.run.app"
+
+_emit_lock = threading.Lock()
+
+
+def emit(event, **fields):
+    with _emit_lock:
+        sys.stdout.write(json.dumps(dict(event=event, time=round(time.time(), 3), **fields), ensure_ascii=False) + "\n")
+        sys.stdout.flush()
+
+
+class ProgressEmitter:
+    """단계별 진행률: 값이 바뀌었을 때만, 최대 0.5초에 한 번 출력"""
+    def __init__(self, stage):
+        self.stage = stage
+        self.last_value = None
+        self.last_emit = 0.0
+
+    def __call__(self, value, **fields):
+        now = time.monotonic()
+        if value != self.last_value and (value >= 100 or now - self.last_emit >= 0.5):
+            self.last_value = value
+            self.last_emit = now
+            emit("progress", stage=self.stage, value=value, **fields)
+
+
+def load_results(folder):
+    """폴더 스캔 + 스냅샷 비교, 바뀌지 않은 파일은 이전 결과 재사용"""
+    files = []
+    for entry in scan_library(folder):
+        files.append(entry)
+        if len(files) % 1000 == 0:
+            emit("progress", stage="scan", found=len(files))
+    files.sort(key=lambda x: x['rel_path'])
+    emit("scan", files=len(files))
+
+    rows, diff = diff_snapshot(files, load_snapshot(folder))
+    emit("snapshot", **diff)
+
+    # 행 생성은 파일마다 정규식 하나라서 프로세스로 넘기는 비용이 더 크므로 여기서 바로 만든다
+    results = []
+    for entry, previous in rows:
+        if previous and previous.get('original') == entry['name']:
+            results.append(dict(previous, path=entry['path']))
+            continue
+        result = build_file_result(entry)
+        if previous:
+            result['game_data'] = previous.get('game_data') or {}
+        results.append(result)
+    return results
+
+
+def fetch_metadata(results, server_url, pool, refetch_all=False):
+    rows = [
+        i for i, r in enumerate(results)
+        if refetch_all or not r.get('game_data') or 'error' in r['game_data']
+    ]
+    if not rows:
+        emit("fetch", requested=0)
+        return
+    emit("fetch", requested=len(rows))
+
+    fetcher = GameFetcher(server_url, [results[i]['relative_path'] for i in rows])
+    # 상품 페이지 파싱(CPU)은 프로세스 풀로, 네트워크 대기는 기존 크롤링 스레드 풀에서
+    fetcher.parse_page = lambda html, url: pool.submit(parse_dlsite_html, html, url).result()
+
+    progress = ProgressEmitter("fetch")
+    fetcher.progress.connect(progress)
+    fetcher.log.connect(lambda message: logging.info(f"[fetch] {message}"))
+    fetcher.error.connect(lambda message: emit("error", stage="fetch", message=message))
+
+    def on_result(game_data):
+        index = build_result_index(game_data)
+        failed = 0
+        for i in rows:
+            match = lookup_result(index, results[i].get('rj_code'), results[i].get('original'))
+            if not apply_match(results[i], match):
+                failed += 1
+        emit("fetched", rows=len(rows), failed=failed)
+
+    def on_updated(game_data):
+        index = build_result_index(game_data)
+        updated = 0
+        for result in results:
+            match = lookup_result(index, result.get('rj_code'), result.get('original'))
+            if match and 'error' not in match and apply_match(result, match):
+                updated += 1
+        emit("updated", rows=updated)
+
+    fetcher.result.connect(on_result)
+    fetcher.updated.connect(on_updated)
+    fetcher.run()
+
+
+def build_requests(args, results):
+    # GUI 에서는 사용자가 체크한 행만 바꾸므로, 여기서는 기본으로 RJ 코드가 확인된 행만 대상 (--include-unmatched 로 전체)
+    rows = [i for i, r in enumerate(results) if args.include_unmatched or is_resolved_rj(r)]
+    if args.organize:
+        return build_organize_requests(results, rows, args.target, args.organize)
+
+    requests = []
+    for i in rows:
+        result = results[i]
+        original_name = os.path.basename(result['path'])
+        new_name = result['suggested']
+        original_ext = os.path.splitext(original_name)[1]
+        if not new_name.lower().endswith(original_ext.lower()):
+            new_name += original_ext
+        if new_name == original_name or '[오류]' in new_name:
+            continue
+        requests.append({'row': i, 'src': result['path'], 'dst': os.path.join(os.path.dirname(result['path']), new_name)})
+    return requests
+
+
+def has_data(result):
+    game_data = result.get('game_data') or {}
+    return bool(game_data) and 'error' not in game_data
+
+
+def is_resolved_rj(result):
+    """RJ 코드로 실제 작품 정보를 찾은 행 (오류 / 404 대체 데이터 / RJ 코드 없는 행 제외)"""
+    if not result.get('rj_code') or not has_data(result):
+        return False
+    game_data = result['game_data']
+    if game_data.get('status') == '404' or game_data.get('permanent_error'):
+        return False
+    return game_data.get('platform', 'rj') == 'rj' and bool(game_data.get('title_kr') or game_data.get('title_jp'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GameSorter headless batch mode")
+    parser.add_argument("folder", help="Library folder to scan")
+    parser.add_argument("--server", default=os.getenv("GAMESORTER_API_URL", DEFAULT_SERVER_URL), help="GameSorter API URL")
+    parser.add_argument("--apply", action="store_true", help="Actually rename/move files (default: dry-run)")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 2, help="Worker processes for DLsite page parsing")
+    parser.add_argument("--refetch", action="store_true", help="Fetch metadata again even for rows cached in the snapshot")
+    parser.add_argument("--include-unmatched", action="store_true", help="Also rename/move rows that are not resolved RJ works (no metadata, 404 fallback, no RJ code)")
+    parser.add_argument("--organize", choices=sorted(set(ORGANIZE_MODES.values())), help="Move files into tag/maker/year folders")
+    parser.add_argument("--target", help="Target root for --organize")
+    parser.add_argument("--move-workers", type=int, default=int(os.getenv("GAMESORTER_MOVE_WORKERS", "4")))
+    parser.add_argument("--log", default="gamesort_cli.log", help="Log file path")
+    args = parser.parse_args()
+
+    if args.organize and not args.target:
+        parser.error("--organize requires --target")
+
+    logging.basicConfig(filename=args.log, level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    load_dotenv()
+    folder = os.path.abspath(args.folder)
+    started = time.monotonic()
+    emit("start", folder=folder, apply=args.apply, processes=args.processes)
+
+    try:
+        results = load_results(folder)
+        if not results:
+            emit("done", files=0, planned=0, applied=0, errors=0, elapsed=round(time.monotonic() - started, 2))
+            return 0
+        # 페이지 파싱 프로세스는 크롤링 스레드에서 처음 submit 할 때 만들어지므로 fork 대신 spawn
+        # (다른 스레드가 돌고 있는 상태에서 fork 하면 잠금이 잡힌 채 복제될 수 있음)
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=args.processes, mp_context=multiprocessing.get_context('spawn')) as pool:
+            fetch_metadata(results, args.server, pool, refetch_all=args.refetch)
+        save_snapshot(folder, results)
+
+        steps, _ = build_rename_plan(build_requests(args, results))
+        for step in steps:
+            emit("plan", row=step['row'], src=step['src'], dst=step['dst'])
+
+        completed, errors = [], []
+        if args.apply and steps:
+            progress = ProgressEmitter("rename")
+            completed, errors = execute_plan(
+                steps, RenameJournal(), kind='organize' if args.organize else 'rename',
+                progress=lambda current, total, step: progress(int(current / total * 100), done=current, total=total),
+                workers=args.move_workers
+            )
+            # 실행된 단계를 순서대로 따라가며 경로로 행을 찾아 갱신 (임시 이름 단계 포함, core.on_rename_done 과 같음)
+            path_rows = {os.path.normcase(r['path']): row for row, r in enumerate(results)}
+            for step in completed:
+                row = path_rows.pop(os.path.normcase(step['src']), step['row'])
+                if row is None:
+                    continue
+                path_rows[os.path.normcase(step['dst'])] = row
+                results[row]['path'] = step['dst']
+                try:
+                    results[row]['relative_path'] = os.path.relpath(step['dst'], folder)
+                except ValueError:
+                    # 다른 드라이브로 정리된 파일: 절대 경로 유지
+                    results[row]['relative_path'] = step['dst']
+            for step, message in errors:
+                emit("error", stage="rename", src=step['src'], dst=step['dst'], message=message)
+            save_snapshot(folder, results)
+
+        emit("done",
+             files=len(results),
+             matched=sum(1 for r in results if is_resolved_rj(r)),
+             planned=sum(1 for s in steps if not is_temp_path(s['dst'])),
+             applied=sum(1 for s in completed if not is_temp_path(s['dst'])),
+             errors=len(errors),
+             elapsed=round(time.monotonic() - started, 2))
+        return 1 if errors else 0
+    except Exception as e:
+        logging.error(f"CLI error: {e}", exc_info=True)
+        emit("error", stage="run", message=str(e))
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
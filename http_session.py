@@ -0,0 +1,136 @@
+import os
+import logging
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+def env_flag(name, default=False):
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# httpx 응답을 requests 응답처럼 쓰기 위한 래퍼
+class _HttpxResponse:
+    def __init__(self, response, stream=False):
+        self._response = response
+        self.status_code = response.status_code
+        self.url = str(response.url)
+        self.headers = response.headers
+        self.encoding = response.encoding
+        self._content = None if stream else response.content
+
+    @property
+    def content(self):
+        if self._content is None:
+            self._content = self._response.read()
+        return self._content
+
+    @property
+    def text(self):
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+    def iter_content(self, chunk_size=None):
+        if self._content is not None:
+            yield self._content
+            return
+        yield from self._response.iter_bytes(chunk_size)
+
+    def close(self):
+        self._response.close()
+
+    def json(self):
+        return self._response.json()
+
+    def raise_for_status(self):
+        try:
+            self._response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            raise requests.exceptions.HTTPError(str(e)) from e
+
+
+# 연결 재사용 HTTP 세션 (DLsite / GameSorter API / 썸네일 공용)
+class PooledSession:
+    def __init__(self, pool_size=None, keep_alive=None, http2=None):
+        self.pool_size = pool_size or int(os.getenv("GAMESORTER_HTTP_POOL_SIZE", "16"))
+        self.keep_alive = env_flag("GAMESORTER_HTTP_KEEPALIVE", True) if keep_alive is None else keep_alive
+        http2 = env_flag("GAMESORTER_HTTP2", False) if http2 is None else http2
+
+        self.request_count = 0
+        self.lock = threading.Lock()
+        self.client = None
+        self.session = None
+
+        if http2 and httpx is not None:
+            try:
+                self.client = httpx.Client(
+                    http2=True,
+                    follow_redirects=True,
+                    limits=httpx.Limits(
+                        max_connections=self.pool_size,
+                        max_keepalive_connections=self.pool_size if self.keep_alive else 0
+                    )
+                )
+                logging.info(f"[http] HTTP/2 세션 사용 (pool={self.pool_size})")
+            except Exception as e:
+                logging.warning(f"[http] HTTP/2 초기화 실패, requests 세션으로 대체: {e}")
+                self.client = None
+        elif http2:
+            logging.warning("[http] httpx 미설치, HTTP/1.1 세션 사용")
+
+        if self.client is None:
+            self.session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+            if not self.keep_alive:
+                self.session.headers['Connection'] = 'close'
+            logging.info(f"[http] 세션 생성 (pool={self.pool_size}, keep_alive={self.keep_alive})")
+
+    def request(self, method, url, **kwargs):
+        with self.lock:
+            self.request_count += 1
+        if self.client is not None:
+            stream = kwargs.pop('stream', False)
+            try:
+                if stream:
+                    cookies = kwargs.pop('cookies', None)
+                    request = self.client.build_request(method.upper(), url, cookies=cookies, **kwargs)
+                    response = self.client.send(request, stream=True)
+                else:
+                    response = self.client.request(method.upper(), url, **kwargs)
+            except httpx.HTTPError as e:
+                raise requests.exceptions.ConnectionError(str(e)) from e
+            return _HttpxResponse(response, stream=stream)
+        return self.session.request(method.upper(), url, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request('get', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('post', url, **kwargs)
+
+    def connection_stats(self):
+        """요청 수와 실제로 새로 연 연결 수 (핸드셰이크 횟수)"""
+        connections = 0
+        if self.session is not None:
+            for adapter in set(self.session.adapters.values()):
+                pools = adapter.poolmanager.pools
+                for key in list(pools.keys()):
+                    pool = pools.get(key)
+                    if pool is not None:
+                        connections += getattr(pool, 'num_connections', 0)
+        return {'requests': self.request_count, 'connections': connections}
+
+    def close(self):
+        if self.client is not None:
+            self.client.close()
+        if self.session is not None:
+            self.session.close()
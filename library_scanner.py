@@ -0,0 +1,63 @@
+import os
+import logging
+import concurrent.futures
+
+GAME_EXTENSIONS = ('.zip', '.7z', '.rar', '.tar', '.gz')
+
+
+def scan_directory(path):
+    """한 디렉터리만 읽어 (압축 파일 항목, 하위 디렉터리) 반환, DirEntry 의 타입 정보를 그대로 사용"""
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif os.path.splitext(entry.name)[1].lower() in GAME_EXTENSIONS and entry.is_file():
+                        st = entry.stat()
+                        files.append({
+                            'path': entry.path,
+                            'name': entry.name,
+                            'size': st.st_size,
+                            'mtime': st.st_mtime,
+                            # Windows 에서는 inode() 가 파일마다 추가 시스템 콜(SMB 왕복)이라 읽지 않음 (0 = 비교 안 함)
+                            'inode': entry.inode() if os.name != 'nt' else 0
+                        })
+                except OSError as e:
+                    logging.warning(f"[scan] 항목 확인 실패: {entry.path}: {e}")
+    except OSError as e:
+        logging.warning(f"[scan] 디렉터리 읽기 실패: {path}: {e}")
+    return files, subdirs
+
+
+def scan_library(root, max_workers=8):
+    """root 아래 압축 파일을 찾는 대로 하나씩 반환 (하위 디렉터리는 스레드 풀에서 병렬 탐색)
+
+    각 항목: path, rel_path, name, size, mtime, inode
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(scan_directory, root)}
+        while pending:
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                files, subdirs = future.result()
+                for subdir in subdirs:
+                    pending.add(executor.submit(scan_directory, subdir))
+                for entry in files:
+                    entry['rel_path'] = os.path.relpath(entry['path'], root)
+                    yield entry
+
+
+def walk_directories(root):
+    """root 와 그 아래 모든 디렉터리 경로 (폴더 감시 등록용)"""
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        yield path
+        try:
+            with os.scandir(path) as it:
+                stack.extend(entry.path for entry in it if entry.is_dir(follow_symlinks=False))
+        except OSError as e:
+            logging.warning(f"[scan] 디렉터리 읽기 실패: {path}: {e}")
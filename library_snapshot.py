@@ -0,0 +1,86 @@
+import os
+import json
+import hashlib
+import logging
+
+# 마지막 스캔 결과(경로, 크기, 수정 시각, inode, RJ 코드, 가져온 메타데이터) 저장
+# 다시 스캔할 때 바뀌지 않은 파일은 이전 결과를 그대로 쓴다
+
+SNAPSHOT_VERSION = 1
+
+
+def snapshot_path(folder_path):
+    snapshot_dir = os.getenv("GAMESORTER_SNAPSHOT_DIR", "snapshots")
+    key = hashlib.sha1(os.path.normcase(os.path.abspath(folder_path)).encode('utf-8')).hexdigest()
+    return os.path.join(snapshot_dir, key + ".json")
+
+
+def load_snapshot(folder_path):
+    path = snapshot_path(folder_path)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != SNAPSHOT_VERSION:
+            return {}
+        return data.get('files', {})
+    except Exception as e:
+        logging.warning(f"[snapshot] 읽기 실패: {path}: {e}")
+        return {}
+
+
+def save_snapshot(folder_path, results):
+    path = snapshot_path(folder_path)
+    files = {}
+    for result in results:
+        rel_path = result.get('relative_path')
+        if not rel_path:
+            continue
+        files[rel_path] = {
+            'size': result.get('size'),
+            'mtime': result.get('mtime'),
+            'inode': result.get('inode'),
+            'rj_code': result.get('rj_code'),
+            'result': {k: v for k, v in result.items() if k != 'path'}
+        }
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': SNAPSHOT_VERSION, 'folder': folder_path, 'files': files}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        logging.debug(f"[snapshot] {len(files)}개 항목 저장: {path}")
+    except Exception as e:
+        logging.error(f"[snapshot] 저장 실패: {path}: {e}")
+
+
+def is_unchanged(entry, previous):
+    if previous.get('size') != entry['size'] or previous.get('mtime') != entry['mtime']:
+        return False
+    # inode 를 알 수 없는 파일시스템(0)에서는 크기/수정 시각만 비교
+    if previous.get('inode') and entry.get('inode') and previous['inode'] != entry['inode']:
+        return False
+    return True
+
+
+def diff_snapshot(entries, snapshot):
+    """스캔 항목과 스냅샷 비교: ([(entry, 이전 result 또는 None)], 통계)"""
+    rows = []
+    stats = {'unchanged': 0, 'added': 0, 'changed': 0, 'removed': 0}
+    seen = set()
+    for entry in entries:
+        rel_path = entry['rel_path']
+        seen.add(rel_path)
+        previous = snapshot.get(rel_path)
+        if previous is None:
+            stats['added'] += 1
+            rows.append((entry, None))
+        elif is_unchanged(entry, previous):
+            stats['unchanged'] += 1
+            rows.append((entry, previous['result']))
+        else:
+            stats['changed'] += 1
+            rows.append((entry, None))
+    stats['removed'] = len(set(snapshot) - seen)
+    return rows, stats
@@ -0,0 +1,107 @@
+import os
+import json
+import time
+import sqlite3
+import threading
+import logging
+
+
+# RJ 코드별 게임 메타데이터 로컬 캐시 (SQLite)
+# permanent_error(404) 항목은 negative 로 표시하고 별도 TTL 적용
+class MetadataStore:
+    def __init__(self, path=None, ttl=None, negative_ttl=None):
+        self.path = path or os.getenv("GAMESORTER_CACHE_DB", "gamesort_cache.db")
+        self.ttl = ttl if ttl is not None else float(os.getenv("GAMESORTER_CACHE_TTL", str(7 * 24 * 3600)))
+        self.negative_ttl = negative_ttl if negative_ttl is not None else float(os.getenv("GAMESORTER_NEGATIVE_TTL", str(3 * 24 * 3600)))
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS games ("
+            "rj_code TEXT PRIMARY KEY, data TEXT NOT NULL, "
+            "negative INTEGER NOT NULL DEFAULT 0, stored_at REAL NOT NULL)"
+        )
+        self.conn.commit()
+        # 만료된 항목은 다시 읽히지 않으므로 열 때 정리 (DB 파일이 계속 커지지 않도록)
+        purged = self.purge_expired()
+        if purged:
+            logging.info(f"[store] 만료 항목 {purged}개 삭제")
+
+    @staticmethod
+    def is_negative(data):
+        return bool(data.get('permanent_error') or data.get('status') == '404')
+
+    def _is_fresh(self, negative, stored_at, now):
+        ttl = self.negative_ttl if negative else self.ttl
+        return now - stored_at < ttl
+
+    def get_many(self, rj_codes):
+        """만료되지 않은 항목만 {rj_code: data} 로 반환"""
+        codes = list({c for c in rj_codes if c})
+        found = {}
+        now = time.time()
+        with self.lock:
+            for start in range(0, len(codes), 500):
+                part = codes[start:start + 500]
+                rows = self.conn.execute(
+                    f"SELECT rj_code, data, negative, stored_at FROM games WHERE rj_code IN ({','.join('?' * len(part))})",
+                    part
+                ).fetchall()
+                for rj_code, data, negative, stored_at in rows:
+                    if self._is_fresh(negative, stored_at, now):
+                        found[rj_code] = json.loads(data)
+        self.hits += len(found)
+        self.misses += len(codes) - len(found)
+        logging.debug(f"[store] 조회 {len(codes)}개, 적중 {len(found)}개")
+        return found
+
+    def put_many(self, records):
+        now = time.time()
+        rows = [
+            (d['rj_code'], json.dumps(d, ensure_ascii=False), int(self.is_negative(d)), now)
+            for d in records if d and d.get('rj_code')
+        ]
+        if not rows:
+            return
+        with self.lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO games (rj_code, data, negative, stored_at) VALUES (?, ?, ?, ?)",
+                rows
+            )
+            self.conn.commit()
+        logging.debug(f"[store] {len(rows)}개 항목 저장")
+
+    def purge_expired(self):
+        now = time.time()
+        with self.lock:
+            cur = self.conn.execute(
+                "DELETE FROM games WHERE (negative = 0 AND stored_at < ?) OR (negative = 1 AND stored_at < ?)",
+                (now - self.ttl, now - self.negative_ttl)
+            )
+            self.conn.commit()
+        return cur.rowcount
+
+    def stats(self):
+        now = time.time()
+        with self.lock:
+            total, negative = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(negative), 0) FROM games"
+            ).fetchone()
+            stale = self.conn.execute(
+                "SELECT COUNT(*) FROM games WHERE (negative = 0 AND stored_at < ?) OR (negative = 1 AND stored_at < ?)",
+                (now - self.ttl, now - self.negative_ttl)
+            ).fetchone()[0]
+        size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        return {
+            'entries': total,
+            'negative': negative,
+            'stale': stale,
+            'bytes': size,
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+    def close(self):
+        with self.lock:
+            self.conn.close()
@@ -0,0 +1,39 @@
+import os
+import re
+
+# 정리 모드: game_data 의 태그 / 제작자 / 출시 연도로 대상 폴더 구조를 만든다
+ORGANIZE_MODES = {
+    "태그별": "tag",
+    "제작자별": "maker",
+    "출시 연도별": "year",
+}
+
+
+def safe_folder_name(name):
+    name = re.sub(r'[?*:"<>|\\\\/]', '', name or '').strip().rstrip('.')
+    return name or '기타'
+
+
+def organize_group(result, mode):
+    game_data = result.get('game_data') or {}
+    if 'error' in game_data:
+        game_data = {}
+    if mode == 'tag':
+        return safe_folder_name(result.get('selected_tag') or game_data.get('primary_tag'))
+    if mode == 'maker':
+        return safe_folder_name(game_data.get('maker'))
+    if mode == 'year':
+        match = re.search(r'(19|20)\d{2}', game_data.get('release_date') or '')
+        return match.group(0) if match else '기타'
+    raise ValueError(f"unknown organize mode: {mode}")
+
+
+def build_organize_requests(results, rows, target_root, mode):
+    """선택된 행을 target_root/<그룹>/<현재 파일명> 으로 옮기는 요청 목록 (rename_engine.build_rename_plan 입력)"""
+    requests = []
+    for row in rows:
+        result = results[row]
+        src = result['path']
+        dst = os.path.join(target_root, organize_group(result, mode), os.path.basename(src))
+        requests.append({'row': row, 'src': src, 'dst': dst})
+    return requests
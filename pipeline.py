@@ -0,0 +1,693 @@
+import os
+import re
+import time
+import logging
+import requests
+import tenacity
+import concurrent.futures
+from rate_limit import HostLimiter
+from http_session import PooledSession, env_flag
+from upload_queue import UploadQueue
+from metadata_store import MetadataStore
+from dlsite_parser import parse_dlsite_html, read_product_page
+from library_scanner import GAME_EXTENSIONS
+
+
+class Callback:
+    """Qt Signal 과 같은 connect / emit 인터페이스 (PySide6 없이 실행할 때 사용)"""
+    def __init__(self):
+        self.handlers = []
+
+    def connect(self, handler):
+        self.handlers.append(handler)
+
+    def emit(self, *args):
+        for handler in self.handlers:
+            handler(*args)
+
+# 유틸리티 함수
+def needs_translation(text):
+    return bool(re.search(r'[\u3040-\u30FF\u4E00-\u9FFF]', text or ''))
+
+def is_valid_game_file(full_path):
+    ext = os.path.splitext(full_path)[1].lower()
+    return ext in GAME_EXTENSIONS and os.path.isfile(full_path)
+
+def clean_rj_code(title, rj_code):
+    if not title or not rj_code:
+        return title
+    patterns = [
+        rf"[\[\(]?\b{rj_code}\b[\]\)]?[)\s,;：]*",
+        rf"[ _\-]?\bRJ\s*{rj_code[2:]}\b",
+        rf"\b{rj_code}\b",
+        rf"\bRJ\s*{rj_code[2:]}\b"
+    ]
+    cleaned = title
+    for pattern in patterns:
+        cleaned = re.sub(pattern, "", cleaned, flags=re.IGNORECASE).strip()
+    logging.debug(f"Clean RJ code: {title} -> {cleaned}")
+    return cleaned
+
+def build_result_index(results):
+    """서버 응답 목록을 rj_code / 제목(title_kr) 기준 딕셔너리로 변환 (먼저 나온 항목 우선)"""
+    by_rj = {}
+    by_title = {}
+    for d in results or []:
+        rj_code = d.get('rj_code')
+        if rj_code:
+            by_rj.setdefault(rj_code, d)
+        title_kr = d.get('title_kr')
+        if title_kr:
+            by_title.setdefault(title_kr, d)
+    return by_rj, by_title
+
+def lookup_result(index, rj_code, title):
+    by_rj, by_title = index
+    if rj_code:
+        return by_rj.get(rj_code)
+    return by_title.get(title)
+
+def build_file_result(entry):
+    """스캔 항목 하나로 테이블 행 데이터(result) 생성"""
+    original = entry['name']
+    ext = os.path.splitext(original)[1]
+
+    rj_match = re.search(r"[Rr][Jj][_\-\s]?(\d{6,8})", original, re.IGNORECASE)
+    rj_code = ''
+    if rj_match:
+        full_match = rj_match.group(0)
+        rj_code = re.sub(r'[_\-\s]', '', full_match).upper()
+
+    original_title = os.path.splitext(original)[0]
+    if rj_code:
+        original_title = clean_rj_code(original_title, rj_code)
+        if not original_title.strip():
+            original_title = ''
+    else:
+        if original_title.strip() == ext or not original_title.strip():
+            original_title = ''
+
+    final_title = original_title or os.path.splitext(original)[0]
+    if not final_title.lower().endswith(ext.lower()):
+        final_title += ext
+
+    return {
+        'original': original,
+        'original_title': original_title,
+        'rj_code': rj_code,
+        'suggested': f"[{rj_code or '기타'}][기타] {final_title}",
+        'selected_tag': "기타",
+        'selected_title_source': "기존 이름",
+        'path': entry['path'],
+        'game_data': {},
+        'relative_path': entry['rel_path'],
+        'size': entry['size'],
+        'mtime': entry['mtime'],
+        'inode': entry.get('inode')
+    }
+
+def title_for_source(result, selected_source):
+    game_data = result.get('game_data') or {}
+    title_kr = game_data.get('title_kr', '').strip()
+    title_jp = game_data.get('title_jp', '').strip()
+    original_title = result.get('original_title', '').strip()
+    original = result.get('original', '').strip()
+    original_filename = game_data.get('original_filename', '').strip()
+    rj_code = result.get('rj_code') or "기타"
+
+    if selected_source == "기존 이름":
+        return original_title or original_filename or original or rj_code
+    if selected_source == "한국어 이름":
+        return title_kr or title_jp or original_title or original_filename or original or rj_code
+    # 일본어 이름
+    return title_jp or title_kr or original_title or original_filename or original or rj_code
+
+def default_title_source(result):
+    # 기존 우선순위: original_title(일본어 아님) > title_kr > title_jp > 기존 이름
+    game_data = result.get('game_data') or {}
+    original_title = result.get('original_title', '').strip()
+    if original_title and not needs_translation(original_title):
+        return "기존 이름"
+    if game_data.get('title_kr', '').strip():
+        return "한국어 이름"
+    if game_data.get('title_jp', '').strip():
+        return "일본어 이름"
+    return "기존 이름"
+
+def suggest_name(result, tag=None, title_source=None):
+    """선택된 태그 / 제목 소스로 제안 파일명을 계산해 result 에 반영하고 반환"""
+    rj_code = result.get('rj_code') or "기타"
+
+    # 드롭다운에서 선택된 제목 소스 사용, 없으면 기존 우선순위
+    selected_source = title_source or default_title_source(result)
+    result['selected_title_source'] = selected_source
+    title = title_for_source(result, selected_source)
+
+    # 태그가 제공되지 않으면 기존 태그 사용
+    if tag is None:
+        tag = result.get('selected_tag', '기타')
+
+    # RJ 코드 / 특수문자 제거
+    title = clean_rj_code(title, rj_code)
+    title = re.sub(r'[?*:"<>|]', '', title).replace('/', '-').strip()
+
+    original_ext = os.path.splitext(result.get('original', '').strip())[1]
+    if not title:
+        result['suggested'] = f"[{rj_code}][{tag}]{original_ext}"
+    elif title.lower().endswith(original_ext.lower()):
+        result['suggested'] = f"[{rj_code}][{tag}] {title}"
+    else:
+        result['suggested'] = f"[{rj_code}][{tag}] {title}{original_ext}"
+
+    result['selected_tag'] = tag if tag else "기타"
+    return result['suggested']
+
+def apply_match(result, match):
+    """서버/크롤링 결과 하나를 행 데이터에 반영하고 제안 이름 계산, 실패 항목이면 False"""
+    if not match or 'error' in match:
+        result['selected_tag'] = '기타'
+        result['selected_title_source'] = '기존 이름'
+        suggest_name(result, '기타')
+        return False
+
+    result['game_data'] = match
+    tags = [t for t in match.get('tags') or ['기타'] if t.strip()]
+    tag = match.get('primary_tag') or (tags[0] if tags else '기타')
+    if not tag or tag.strip() == '':
+        tag = '기타'
+
+    result['selected_tag'] = tag
+    result['selected_title_source'] = default_title_source(result)
+    suggest_name(result, tag)
+    return True
+
+# 서버 조회 → 로컬 캐시 → 크롤링 → 번역 결과 재조회 파이프라인 (Qt 없이 실행 가능)
+# GUI 에서는 core.FetchWorker 가 QThread 안에서 실행하고, 아래 콜백 자리에 Qt 시그널을 연결한다
+class GameFetcher:
+
+    def __init__(self, server_url, items, folder_path=None, use_firestore_cache=True,
+                 crawl_workers=None, per_host_limit=None, crawl_rate=None, completion_timeout=None,
+                 chunk_size=None, chunk_concurrency=None):
+        self.progress = Callback()
+        self.log = Callback()
+        self.result = Callback()
+        self.updated = Callback()
+        self.error = Callback()
+        self.finished = Callback()
+
+        self.server_url = server_url
+        self.items = items
+        self.folder_path = folder_path
+        self.use_firestore_cache = use_firestore_cache
+
+        # 크롤링 동시성 / 속도 제한 설정 (DLsite 차단 방지)
+        self.crawl_workers = crawl_workers or int(os.getenv("GAMESORTER_CRAWL_WORKERS", "8"))
+        per_host_limit = per_host_limit or int(os.getenv("GAMESORTER_CRAWL_PER_HOST", "4"))
+        crawl_rate = crawl_rate or float(os.getenv("GAMESORTER_CRAWL_RATE", "3"))
+        self.crawl_limiter = HostLimiter(per_host_limit=per_host_limit, rate_per_sec=crawl_rate)
+
+        # /games 요청 청크 크기와 동시 전송 수
+        self.chunk_size = max(1, chunk_size or int(os.getenv("GAMESORTER_CHUNK_SIZE", "100")))
+        self.chunk_concurrency = max(1, chunk_concurrency or int(os.getenv("GAMESORTER_CHUNK_CONCURRENCY", "4")))
+
+        # 크롤링 저장 항목의 서버 반영 대기 최대 시간 (초)
+        self.completion_timeout = completion_timeout or float(os.getenv("GAMESORTER_COMPLETION_TIMEOUT", "30"))
+
+        # 상품 페이지를 스트리밍으로 받아 메타데이터 블록 이후는 읽지 않음
+        self.stream_pages = env_flag("GAMESORTER_STREAM_PAGES", True)
+
+        # DLsite / 서버 요청이 함께 쓰는 연결 풀
+        self.session = PooledSession(pool_size=max(self.crawl_workers, 4) * 2)
+
+        # 상품 페이지 파서 (헤드리스 실행에서는 프로세스 풀로 넘기는 함수로 교체)
+        self.parse_page = parse_dlsite_html
+
+        # 크롤링 결과 배치 업로더 / 로컬 메타데이터 캐시 (run 시작 시 생성)
+        self.uploader = None
+        self.store = None
+
+    @tenacity.retry(
+        stop=tenacity.stop_after_attempt(3),
+        wait=tenacity.wait_exponential(multiplier=1, min=2, max=15),
+        retry=tenacity.retry_if_exception_type(requests.exceptions.RequestException),
+        before_sleep=lambda retry_state: logging.warning(
+            f"Retrying request (attempt {retry_state.attempt_number}/3) after {retry_state.next_action.sleep} seconds"
+        )
+    )
+    def get_dlsite_data(self, rj_code):
+        url = f"https://www.dlsite.com/maniax/work/=/product_id/{rj_code}.html"
+        headers = {
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+            'Accept-Language': 'ja',
+            'Referer': 'https://www.dlsite.com/maniax/',
+            'DNT': '1',
+            'Connection': 'keep-alive'
+        }
+        cookies = {'adultconfirmed': '1'}
+
+        try:
+            logging.info(f"Fetching DLsite data for {rj_code}")
+            with self.crawl_limiter.slot(url):
+                response = self.session.get(url, headers=headers, cookies=cookies, timeout=10, stream=self.stream_pages)
+                try:
+                    response.encoding = 'utf-8'
+
+                    if response.status_code != 200:
+                        raise Exception(f"DLsite fetch failed: Status {response.status_code}")
+
+                    if 'age-verification' in response.url:
+                        html = None
+                    elif self.stream_pages:
+                        # 메타데이터 블록까지만 받고 나머지(리뷰, 추천 목록 등)는 읽지 않음
+                        html, size = read_product_page(response)
+                        logging.debug(f"Streamed {size} bytes for {rj_code}")
+                    else:
+                        html = response.text
+                        if 'adult_check' in html.lower():
+                            html = None
+                finally:
+                    response.close()
+
+            if html is None:
+                logging.warning(f"Adult verification page detected for {rj_code}")
+                raise Exception("Adult verification required")
+
+            parsed = self.parse_page(html, url)
+            if not parsed['title']:
+                logging.error(f"No title found for RJ code {rj_code}")
+                raise Exception("No title found")
+
+            tags_jp = parsed['tags']
+            if not tags_jp:
+                logging.warning(f"No genre tags found for {rj_code}")
+                tags_jp = ["기타"]
+
+            original_title = parsed['title']
+            cleaned_title = clean_rj_code(original_title, rj_code)
+
+            data = {
+                'rj_code': rj_code,
+                'title_jp': cleaned_title,
+                'original_title_jp': original_title,
+                'tags_jp': tags_jp,
+                'release_date': parsed['release_date'] or 'N/A',
+                'thumbnail_url': parsed['thumbnail_url'],
+                'maker': parsed['maker'] or 'N/A',
+                'link': url,
+                'platform': 'rj',
+                'rating': 0.0,
+                'timestamp': time.time()
+            }
+            logging.info(f"Fetched DLsite data for {rj_code}, title_jp={cleaned_title}, tags_jp={tags_jp}")
+            return data
+
+        except Exception as e:
+            logging.error(f"Error fetching DLsite data for {rj_code}: {e}", exc_info=True)
+
+            fallback = {
+                'error': f'Game not found for {rj_code}',
+                'rj_code': rj_code,
+                'platform': 'rj',
+                'title_jp': '',
+                'tags': [],
+                'tags_jp': [],
+                'thumbnail_url': '',
+                'primary_tag': '기타',
+                'rating': 0.0,
+                'release_date': 'N/A',
+                'maker': '',
+                'link': '',
+                'status': '404',
+                'permanent_error': True,
+                'skip_translation': True,
+                'timestamp': time.time()
+            }
+            return fallback
+
+    @tenacity.retry(
+        stop=tenacity.stop_after_attempt(5),
+        wait=tenacity.wait_exponential(multiplier=1, min=2, max=15),
+        retry=tenacity.retry_if_exception_type(requests.exceptions.RequestException),
+        before_sleep=lambda retry_state: logging.warning(
+            f"Retrying server request (attempt {retry_state.attempt_number}/5) after {retry_state.next_action.sleep} seconds"
+        )
+    )
+    def make_request(self, url, method='post', json_data=None, timeout=30):
+        logging.debug(f"Sending {method.upper()} request to {url}")
+        try:
+            if method == 'post':
+                response = self.session.post(url, json=json_data, timeout=timeout)
+            else:
+                response = self.session.get(url, timeout=timeout)
+            response.raise_for_status()
+            return response.json()
+        except Exception as e:
+            logging.error(f"Request failed: {e}")
+            raise
+    
+    def strip_local_fields(self, item):
+        return {k: v for k, v in item.items() if not k.startswith("original_")}
+
+    def upload_batch(self, records):
+        """업로드 큐에서 모은 크롤링 결과를 한 번의 /games 요청으로 저장"""
+        self.make_request(
+            f"{self.server_url}/games",
+            method='post',
+            json_data={"items": records}
+        )
+
+    def crawl_and_save(self, rj_code, item):
+        """단일 RJ 코드 크롤링 후 업로드 큐에 저장 요청 (크롤링 풀에서 실행)"""
+        try:
+            data = self.get_dlsite_data(rj_code)
+            if data.get('error'):
+                data = self.create_fallback_data(rj_code, item)
+                logging.debug(f"Enhanced fallback data with filename: {item}")
+        except Exception as e:
+            logging.error(f"Local crawl failed for {rj_code}: {e}")
+            data = self.create_fallback_data(rj_code, item)
+
+        self.uploader.put(self.strip_local_fields(data))
+        logging.info(f"[core] 크롤링 완료, 업로드 대기: {rj_code}")
+        return data
+
+    def handle_missing_items(self, missing):
+        """missing 항목 처리를 위한 함수: {rj_code: item} 을 크롤링 풀에서 병렬 처리"""
+        crawled = {}
+        if not missing:
+            return crawled
+
+        total = len(missing)
+        self.log.emit(f"🔍 누락된 항목 {total}개 크롤링 시작 (동시 {self.crawl_workers}개)")
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.crawl_workers) as executor:
+            futures = {
+                executor.submit(self.crawl_and_save, rj, item): rj
+                for rj, item in missing.items()
+            }
+            for i, future in enumerate(concurrent.futures.as_completed(futures)):
+                rj = futures[future]
+                try:
+                    crawled[rj] = future.result()
+                except Exception as e:
+                    logging.error(f"[core] 크롤링 실패: {rj} → {e}")
+                self.progress.emit(int((i + 1) / total * 100))
+                self.log.emit(f"크롤링 중: {rj} ({i + 1}/{total})")
+        return crawled
+
+    def create_fallback_data(self, rj_code, item):
+        """fallback 데이터 생성을 위한 함수"""
+        fallback = {
+            'error': f'Game not found for {rj_code}',
+            'rj_code': rj_code,
+            'platform': 'rj',
+            'title': item,
+            'title_kr': '',
+            'title_jp': '',
+            'original_filename': clean_rj_code(item, rj_code),
+            'tags': ["기타"],
+            'tags_jp': [],
+            'thumbnail_url': '',
+            'primary_tag': '기타',
+            'rating': 0.0,
+            'release_date': 'N/A',
+            'maker': '',
+            'link': '',
+            'status': '404',
+            'permanent_error': True,
+            'skip_translation': True,
+            'timestamp': time.time()
+        }
+        return fallback
+
+    def retry_fetch(self, pending, task_id):
+        """크롤링 후 서버에 저장한 항목만 /progress 로 완료 여부를 확인하고, 완료된 항목만 다시 받아온다"""
+        try:
+            pending = set(pending)
+            logging.debug(f"🔄 retry_fetch 시작: {len(pending)}개 항목, task_id={task_id}")
+
+            if not pending:
+                self.log.emit("재요청할 항목이 없습니다.")
+                logging.debug("🚫 재요청 항목 없음, 함수 종료")
+                return
+
+            self.log.emit(f"🌀 서버 반영 대기: {len(pending)}개 항목")
+            deadline = time.monotonic() + self.completion_timeout
+            delay = 0.5
+            reloaded = 0
+
+            while pending:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logging.warning(f"⏰ 서버 반영 대기 시간 초과, 미완료 {len(pending)}개")
+                    break
+
+                wait = min(remaining, 20)
+                try:
+                    progress = self.make_request(
+                        f"{self.server_url}/progress/{task_id}",
+                        method='post',
+                        json_data={"rj_codes": sorted(pending), "wait": wait},
+                        timeout=wait + 10
+                    )
+                except Exception as e:
+                    logging.error(f"진행 상황 조회 실패: {e}", exc_info=True)
+                    break
+
+                still_pending = set(progress.get('pending', [])) & pending
+                done = pending - still_pending
+                logging.debug(f"📡 progress: status={progress.get('status')}, 완료 {len(done)}개, 대기 {len(still_pending)}개")
+
+                if not done:
+                    # 서버가 long-poll 없이 바로 응답하면 점점 간격을 늘려 재확인
+                    time.sleep(min(delay, max(0, deadline - time.monotonic())))
+                    delay = min(delay * 2, 8)
+                    continue
+
+                response_retry = self.make_request(
+                    f"{self.server_url}/games",
+                    method='post',
+                    json_data={"items": [{"rj_code": rj, "platform": "rj"} for rj in sorted(done)]},
+                    timeout=15
+                )
+                reloaded_results = response_retry.get("results", [])
+                for d in reloaded_results:
+                    rj_code = d.get('rj_code')
+                    if d.get('title_kr'):
+                        d['title_kr'] = clean_rj_code(d['title_kr'], rj_code)
+                    if d.get('title_jp'):
+                        d['title_jp'] = clean_rj_code(d['title_jp'], rj_code)
+                self.updated.emit(reloaded_results)
+                self.store.put_many([
+                    d for d in reloaded_results
+                    if 'error' not in d and d.get('title_kr') and not needs_translation(d['title_kr'])
+                ])
+                reloaded += len(reloaded_results)
+                pending = still_pending
+                delay = 0.5
+
+            self.log.emit(f"✅ 재요청 완료: {reloaded}개 항목")
+            logging.debug(f"✅ 재요청 처리 완료: {reloaded}개 결과")
+        except Exception as e:
+            logging.error(f"retry_fetch 전체 오류: {e}", exc_info=True)
+            self.log.emit(f"재요청 처리 중 오류 발생: {str(e)}")
+        finally:
+            logging.debug("🏁 retry_fetch 함수 종료")
+
+    def run(self):
+        try:
+            self.uploader = UploadQueue(self.upload_batch).start()
+            self.store = MetadataStore()
+            logging.debug(f"[run] 초기 self.items 개수: {len(self.items)}")
+            for idx, item in enumerate(self.items):
+                logging.debug(f"[run] 초기 item[{idx}]: {item}")
+
+            if self.folder_path:
+                logging.debug("[run] 유효성 검사 시작 (full_path 기준)")
+                temp_items = []
+                for idx, item in enumerate(self.items):
+                    full_path = os.path.normpath(os.path.join(self.folder_path, item))
+                    is_valid = is_valid_game_file(full_path)
+                    logging.debug(f"   ↳ 검사 대상: {full_path} → is_valid={is_valid}")
+                    if is_valid:
+                        temp_items.append(item)
+
+                self.items = temp_items
+                logging.debug(f"[run] 필터링 후 self.items 개수: {len(self.items)}")
+                for idx, item in enumerate(self.items):
+                    logging.debug(f"[run] 남은 item[{idx}]: {item}")
+
+            total_items = len(self.items)
+            if total_items == 0:
+                self.log.emit("처리할 압축 파일이 없습니다.")
+                self.result.emit([])
+                return
+
+            self.log.emit(f"총 {total_items}개 파일 처리 시작")
+            logging.info(f"Starting fetch for {total_items} items")
+
+            request_items = []
+            for item in self.items:
+                rj_match = re.match(r'^[Rr][Jj]\d{6,8}$', item, re.IGNORECASE)
+                if rj_match:
+                    rj_code = rj_match.group(0).upper()
+                    request_items.append({'rj_code': rj_code, 'platform': 'rj', 'title': item})
+                else:
+                    rj_match = re.search(r"[Rr][Jj][_\-\s]?(\d{6,8})", item, re.IGNORECASE)
+                    rj_code = ''
+                    if rj_match:
+                        full_match = rj_match.group(0)
+                        rj_code = re.sub(r'[_\-\s]', '', full_match).upper()
+                    request_items.append({
+                        'rj_code': rj_code,
+                        'platform': 'rj' if rj_code else 'steam',
+                        'title': item
+                    })
+                logging.debug(f"Request item: {request_items[-1]}")
+
+            # 로컬 캐시 먼저 확인: 만료되지 않은 항목은 서버/크롤링 생략
+            matches = [None] * total_items
+            known_errors = {}
+            local = self.store.get_many(req_item.get('rj_code') for req_item in request_items)
+            local_hits = []
+            for i, (item, req_item) in enumerate(zip(self.items, request_items)):
+                data = local.get(req_item.get('rj_code'))
+                if not data:
+                    continue
+                if MetadataStore.is_negative(data):
+                    known_errors[data['rj_code']] = self.create_fallback_data(data['rj_code'], item)
+                else:
+                    matches[i] = data
+                    local_hits.append(data)
+            if local_hits:
+                self.updated.emit(local_hits)
+            self.log.emit(f"로컬 캐시: {len(local_hits) + len(known_errors)}개 항목 사용")
+
+            # RJ 코드가 없는 항목은 서버 결과를 쓰지 않으므로 캐시 누락 RJ 항목만 서버에 요청
+            request_idx = [
+                i for i, req_item in enumerate(request_items)
+                if req_item.get('rj_code') and matches[i] is None and req_item['rj_code'] not in known_errors
+            ]
+
+            # 요청을 청크로 나눠 동시에 보내고, 도착한 청크부터 화면에 반영
+            chunks = [
+                request_idx[start:start + self.chunk_size]
+                for start in range(0, len(request_idx), self.chunk_size)
+            ]
+            missing = []
+            task_id = 'none'
+            self.log.emit(f"서버 조회: {len(chunks)}개 청크 (청크당 {self.chunk_size}개, 동시 {self.chunk_concurrency}개)")
+
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.chunk_concurrency) as executor:
+                futures = {
+                    executor.submit(
+                        self.make_request,
+                        f"{self.server_url}/games",
+                        method='post',
+                        json_data={"items": [request_items[i] for i in chunk]}
+                    ): chunk
+                    for chunk in chunks
+                }
+                for done, future in enumerate(concurrent.futures.as_completed(futures)):
+                    chunk = futures[future]
+                    try:
+                        response = future.result()
+                    except Exception as e:
+                        logging.error(f"Server request failed ({len(chunk)} items): {e}", exc_info=True)
+                        self.log.emit(f"서버 요청 실패, 로컬 크롤링으로 대체: {str(e)}")
+                        continue
+
+                    response_data = response.get('results', [])
+                    chunk_missing = response.get("missing", [])
+                    missing.extend(chunk_missing)
+                    if chunk_missing and response.get("task_id"):
+                        task_id = response["task_id"]
+                    logging.info(f"Server response chunk: {len(response_data)} items, missing {len(chunk_missing)}")
+
+                    index = build_result_index(response_data)
+                    chunk_matches = []
+                    for i in chunk:
+                        rj_code = request_items[i].get('rj_code')
+                        match = lookup_result(index, rj_code, self.items[i])
+                        if match and match.get('platform') == 'rj' and 'error' not in match:
+                            if match.get('title_kr'):
+                                match['title_kr'] = clean_rj_code(match['title_kr'], rj_code)
+                            if match.get('title_jp'):
+                                match['title_jp'] = clean_rj_code(match['title_jp'], rj_code)
+                            matches[i] = match
+                            chunk_matches.append(match)
+
+                    if chunk_matches:
+                        self.updated.emit(chunk_matches)
+                        # 번역까지 끝난 항목만 로컬 캐시에 저장
+                        self.store.put_many([
+                            d for d in chunk_matches
+                            if d.get('title_kr') and not needs_translation(d['title_kr'])
+                        ])
+                    self.progress.emit(int((done + 1) / len(chunks) * 100))
+
+            logging.warning(f"[core] 서버 응답 missing 개수: {len(missing)}")
+
+            # 서버에서 찾지 못한 RJ 코드는 중복 없이 한 번만 크롤링
+            to_crawl = {rj: rj for rj in missing if rj not in known_errors}
+            for item, req_item, match in zip(self.items, request_items, matches):
+                rj_code = req_item.get('rj_code')
+                if match is None and rj_code and rj_code not in known_errors:
+                    to_crawl[rj_code] = item
+            crawled = self.handle_missing_items(to_crawl)
+
+            # 영구 실패(404) 항목은 negative 캐시에 저장해 다음 실행에서 재크롤링하지 않음
+            self.store.put_many([d for d in crawled.values() if MetadataStore.is_negative(d)])
+            crawled.update(known_errors)
+
+            final_results = []
+            for i, (item, req_item, match) in enumerate(zip(self.items, request_items, matches)):
+                rj_code = req_item.get('rj_code')
+
+                if match is not None:
+                    final_results.append(match)
+                    logging.debug(f"Server match for {rj_code or item}: {match.get('title_kr')}")
+                elif rj_code:
+                    data = crawled.get(rj_code)
+                    if data is None:
+                        data = self.create_fallback_data(rj_code, item)
+                    final_results.append(data)
+                    logging.debug(f"Process complete for {rj_code}: {data.get('title_jp') or data.get('title_kr')}")
+                else:
+                    final_results.append({
+                        'title': item,
+                        'title_kr': item,
+                        'original_title': item,
+                        'primary_tag': '기타',
+                        'tags': ['기타'],
+                        'thumbnail_url': '',
+                        'platform': 'steam',
+                        'timestamp': time.time()
+                    })
+
+                self.progress.emit(int((i + 1) / total_items * 100))
+                self.log.emit(f"처리 중: {item} ({i + 1}/{total_items})")
+
+            logging.info(f"Returning {len(final_results)} results")
+            self.result.emit(final_results)
+
+            # 크롤링 성공 후 서버에 저장한 항목만 번역 결과를 다시 받는다
+            pending = [rj for rj, data in crawled.items() if 'error' not in data and data.get('title_jp')]
+            self.retry_fetch(pending, task_id)
+            logging.debug("✅ retry_fetch 완료")
+            self.log.emit(f"재로딩 완료")
+
+        except Exception as e:
+            logging.error(f"GameFetcher error: {str(e)}", exc_info=True)
+            self.error.emit(f"작업 실패: {str(e)}")
+        finally:
+            if self.uploader:
+                self.uploader.close()
+            if self.store:
+                logging.info(f"[store] {self.store.stats()}")
+                self.store.close()
+            stats = self.session.connection_stats()
+            logging.info(f"[http] 요청 {stats['requests']}회, 새 연결 {stats['connections']}회")
+            self.session.close()
+            logging.debug("🏁 run 메서드 종료")
+            self.finished.emit()
@@ -0,0 +1,63 @@
+import threading
+import time
+import logging
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+
+# 토큰 버킷 (초당 rate 개, 최대 capacity 개까지 버스트 허용)
+class TokenBucket:
+    def __init__(self, rate, capacity=None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, self.rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self, tokens=1.0):
+        """토큰을 얻을 때까지 대기, 대기한 시간(초) 반환"""
+        if self.rate <= 0:
+            return 0.0
+        waited = 0.0
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return waited
+                delay = (tokens - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+# 호스트별 동시 요청 수 + 요청 속도 제한
+class HostLimiter:
+    def __init__(self, per_host_limit=4, rate_per_sec=2.0, burst=None):
+        self.per_host_limit = max(1, int(per_host_limit))
+        self.rate_per_sec = float(rate_per_sec)
+        self.burst = burst
+        self.semaphores = {}
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def _get(self, host):
+        with self.lock:
+            if host not in self.semaphores:
+                self.semaphores[host] = threading.BoundedSemaphore(self.per_host_limit)
+                self.buckets[host] = TokenBucket(self.rate_per_sec, self.burst)
+            return self.semaphores[host], self.buckets[host]
+
+    @contextmanager
+    def slot(self, url):
+        host = urlparse(url).netloc.lower()
+        semaphore, bucket = self._get(host)
+        with semaphore:
+            waited = bucket.acquire()
+            if waited > 0:
+                logging.debug(f"[rate_limit] {host} 대기 {waited:.2f}초")
+            yield
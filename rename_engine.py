@@ -0,0 +1,259 @@
+import os
+import json
+import time
+import uuid
+import logging
+import threading
+import concurrent.futures
+from file_transfer import move_file, is_cross_device
+
+
+# 이름 변경 계획 / 실행 / 저널
+# 1) 디렉터리마다 한 번만 목록을 읽어 메모리에서 충돌(_1, _2 ...)을 해결하고
+# 2) A→B, B→A 같은 순환은 임시 이름을 거쳐 안전한 순서로 정렬한 뒤
+# 3) 한 단계씩 실행하면서 append-only 저널에 기록 (되돌리기 / 중단 후 복구용)
+
+TEMP_SUFFIX = ".renaming"
+
+
+def is_temp_path(path):
+    return path.endswith(TEMP_SUFFIX)
+
+
+def _key(path):
+    return os.path.normcase(os.path.abspath(path))
+
+
+def _list_names(directory, listdir):
+    try:
+        return {os.path.normcase(name) for name in listdir(directory)}
+    except FileNotFoundError:
+        return set()
+
+
+def unique_name(name, taken):
+    """taken(정규화된 이름 집합)에 없는 이름 반환: name, name_1, name_2 ..."""
+    if os.path.normcase(name) not in taken:
+        return name
+    base, ext = os.path.splitext(name)
+    counter = 1
+    while True:
+        candidate = f"{base}_{counter}{ext}"
+        if os.path.normcase(candidate) not in taken:
+            return candidate
+        counter += 1
+
+
+def build_rename_plan(requests, listdir=os.listdir):
+    """requests: [{'row', 'src', 'dst'}] (dst 는 원하는 전체 경로)
+
+    반환: (실행 순서대로 정렬된 단계 목록, {row: 최종 경로})
+    임시 이름 단계는 row 가 None
+    """
+    moves = [dict(r) for r in requests if _key(r['src']) != _key(r['dst'])]
+    sources_by_dir = {}
+    for move in moves:
+        sources_by_dir.setdefault(_key(os.path.dirname(move['src'])), set()).add(
+            os.path.normcase(os.path.basename(move['src'])))
+
+    # 대상 디렉터리별 사용 중인 이름 = 현재 목록 - 이번에 옮겨 갈 파일 이름
+    taken_by_dir = {}
+
+    def taken_in(directory):
+        dir_key = _key(directory)
+        if dir_key not in taken_by_dir:
+            taken_by_dir[dir_key] = _list_names(directory, listdir) - sources_by_dir.get(dir_key, set())
+        return taken_by_dir[dir_key]
+
+    for move in moves:
+        directory, name = os.path.split(move['dst'])
+        taken = taken_in(directory)
+        name = unique_name(name, taken)
+        taken.add(os.path.normcase(name))
+        move['dst'] = os.path.join(directory, name)
+
+    moves = [m for m in moves if _key(m['src']) != _key(m['dst'])]
+    final_paths = {m['row']: m['dst'] for m in moves}
+
+    # 각 단계는 자기 대상 이름을 아직 쓰고 있는 (다른 단계의) 원본이 먼저 옮겨져야 실행 가능
+    by_src = {_key(m['src']): m for m in moves}
+    waiting_on = {id(m): by_src.get(_key(m['dst'])) for m in moves}
+    state = {}
+    ordered = []
+    for move in moves:
+        path = []
+        current = move
+        while current is not None and id(current) not in state:
+            state[id(current)] = 'visiting'
+            path.append(current)
+            current = waiting_on[id(current)]
+        if current is not None and state[id(current)] == 'visiting':
+            # 순환: 한 파일을 임시 이름으로 먼저 옮겨 고리를 끊는다
+            directory, name = os.path.split(current['src'])
+            taken = taken_in(directory)
+            temp = unique_name(f".{name}{TEMP_SUFFIX}", taken)
+            taken.add(os.path.normcase(temp))
+            temp_path = os.path.join(directory, temp)
+            ordered.append({'row': None, 'src': current['src'], 'dst': temp_path})
+            current['src'] = temp_path
+        for step in reversed(path):
+            state[id(step)] = 'done'
+            ordered.append(step)
+    return ordered, final_paths
+
+
+class RenameJournal:
+    def __init__(self, path=None):
+        self.path = path or os.getenv("GAMESORTER_RENAME_JOURNAL", "rename_journal.jsonl")
+        self.file = None
+        self.batch_id = None
+        self.lock = threading.Lock()
+
+    def _write(self, record):
+        with self.lock:
+            self.file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self.file.flush()
+
+    def begin(self, steps, kind='rename', target=None):
+        self.batch_id = uuid.uuid4().hex
+        self.file = open(self.path, 'a', encoding='utf-8')
+        self._write({'op': 'begin', 'batch': self.batch_id, 'kind': kind, 'target': target,
+                     'time': time.time(), 'steps': [[s['src'], s['dst']] for s in steps]})
+        return self.batch_id
+
+    def record_start(self, src, dst):
+        self._write({'op': 'start', 'batch': self.batch_id, 'src': src, 'dst': dst})
+
+    def record(self, src, dst):
+        self._write({'op': 'done', 'batch': self.batch_id, 'src': src, 'dst': dst})
+
+    def record_failure(self, src, dst, error):
+        self._write({'op': 'fail', 'batch': self.batch_id, 'src': src, 'dst': dst, 'error': error})
+
+    def end(self, status='complete'):
+        self._write({'op': 'end', 'batch': self.batch_id, 'status': status})
+        os.fsync(self.file.fileno())
+        self.file.close()
+        self.file = None
+        self.batch_id = None
+
+    def close_batch(self, batch_id, status):
+        """중단된 배치에 end 기록을 남겨 다음 실행에서 다시 묻지 않게 함"""
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'op': 'end', 'batch': batch_id, 'status': status}, ensure_ascii=False) + "\n")
+
+    def read_batches(self):
+        """저널 전체를 배치 단위로 읽음 (깨진 마지막 줄은 무시)"""
+        batches = {}
+        order = []
+        if not os.path.exists(self.path):
+            return []
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                batch_id = record.get('batch')
+                if record['op'] == 'begin':
+                    batches[batch_id] = dict(record, started=[], done=[], failed=[], status=None)
+                    order.append(batch_id)
+                elif batch_id in batches:
+                    if record['op'] in ('start', 'done', 'fail'):
+                        key = {'start': 'started', 'done': 'done', 'fail': 'failed'}[record['op']]
+                        batches[batch_id][key].append([record['src'], record['dst']])
+                    elif record['op'] == 'end':
+                        batches[batch_id]['status'] = record.get('status', 'complete')
+        return [batches[b] for b in order]
+
+    def incomplete(self):
+        """end 기록 없이 끝난(프로그램 종료/충돌) 배치 목록"""
+        return [b for b in self.read_batches() if b['status'] is None]
+
+    def last_undoable(self):
+        batches = self.read_batches()
+        undone = {b['target'] for b in batches if b['kind'] == 'undo' and b['status'] is not None}
+        for batch in reversed(batches):
+            if batch['kind'] in ('rename', 'organize') and batch['status'] is not None and batch['done'] and batch['batch'] not in undone:
+                return batch
+        return None
+
+
+def completed_steps(batch):
+    """저널의 done 기록 + 시작은 기록됐지만 결과 기록 전에 끊긴 단계 중 실제로 옮겨진 것 (원본은 없고 대상만 있음)"""
+    done = [tuple(step) for step in batch['done']]
+    finished = set(done) | {tuple(step) for step in batch['failed']}
+    for src, dst in batch['started']:
+        if (src, dst) not in finished and not os.path.exists(src) and os.path.exists(dst):
+            done.append((src, dst))
+    return done
+
+
+def undo_steps(batch):
+    """배치에서 실제로 실행된 단계를 역순으로 되돌리는 단계 목록"""
+    return [{'row': None, 'src': dst, 'dst': src} for src, dst in reversed(completed_steps(batch))]
+
+
+def execute_plan(steps, journal, kind='rename', target=None, progress=None, should_stop=None, workers=1):
+    """계획을 실행, 반환: (완료된 단계, [(단계, 오류 메시지)])
+
+    같은 장치 안의 이동(rename)은 계획 순서대로 먼저 실행하고, 다른 장치로의 복사 이동은
+    workers 개 스레드로 병렬 실행한다. 실패한 단계에 의존하는 뒤 단계는 대상이 비어 있지 않거나
+    원본이 없어서 같이 실패하므로 덮어쓰기 없이 나머지 단계는 계속 진행한다
+    """
+    journal.begin(steps, kind=kind, target=target)
+    completed = []
+    errors = []
+    status = 'complete'
+    finished = 0
+
+    def run_step(step):
+        journal.record_start(step['src'], step['dst'])
+        try:
+            method = move_file(step['src'], step['dst'])
+        except Exception as e:
+            logging.error(f"Rename error: {step['src']}: {e}")
+            journal.record_failure(step['src'], step['dst'], str(e))
+            return step, str(e)
+        journal.record(step['src'], step['dst'])
+        if method != "rename":
+            logging.info(f"[move] {method}: {step['src']} → {step['dst']}")
+        return step, None
+
+    def collect(step, error):
+        nonlocal finished, status
+        finished += 1
+        if error is None:
+            completed.append(step)
+        else:
+            errors.append((step, error))
+            status = 'partial'
+        if progress:
+            progress(finished, len(steps), step)
+
+    try:
+        local, remote = [], []
+        for step in steps:
+            (remote if workers > 1 and is_cross_device(step['src'], step['dst']) else local).append(step)
+
+        for step in local:
+            if should_stop and should_stop():
+                status = 'stopped'
+                break
+            collect(*run_step(step))
+
+        if remote and status != 'stopped':
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(run_step, step) for step in remote]
+                for future in concurrent.futures.as_completed(futures):
+                    if future.cancelled():
+                        continue
+                    collect(*future.result())
+                    if status != 'stopped' and should_stop and should_stop():
+                        # 아직 시작하지 않은 복사만 취소, 진행 중인 단계는 끝까지 기다려 기록
+                        status = 'stopped'
+                        for pending in futures:
+                            pending.cancel()
+    finally:
+        journal.end(status)
+    return completed, errors
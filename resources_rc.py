@@ -6,119 +6,118 @@
 from PySide6 import QtCore
 
 qt_resource_data = b"\
-\x00\x00\x06\xe8\
-\x00\
-\x00\x1e)x\xda\xbdYmo\xd4F\x10\xfe\x1e)\xff\
-\xc1\x22\xaaR\x10\x16w\xce\xdb\xc5\xa8\x1f\x0am)\x12\
-T \xda\xf2\xa1\xaa\xa2={\xefn\x89\xcf{Z\xef\
-5\x81\xaaR\x80\xa3BQPi\x9b\xa8\xa0\x86*H\
-)oBj\x14\x225\xa8\xe9\x1f\x8a}\xff\xa1c\x9f\
-\xdf\xbd\xb6\xef\x12h\xfc%Y{g\x9e\x9d\x99gv\
-fr\xe6\x94d\xbf\x5cw\x9e\xecK\xce\xc6V\x7f}\
-\xcd~\xf6\xda9Xq\x9e\xec9\xf7\x1eI\xce\xeav\
-\xff.\xfcq \x9d:3>v\xf52\x22\xe6ub\
-\xeat\xe9\xb4t\xf5:\xd1\x9b\x98K\xdf\x8f\x8fI\xf0\
-SG\xdab\x93\xd1\xae\xa9\xcb\x1a5(S\xa5\x09E\
-W\xf4\xa9\xca\xd9\xc1\xfb`\x11W\xdc\xc7_lP\x93\
-\xcb\x0d\xd4&\xc6MU\x9a\xbc\x8c\x8cf\xd7\x94.P\
-\xde\x22\xda\xe4ii\xf2\x1anR,}u\x11~\xb7\
-\x90i\xc9\x16f\xa4\x11\xdfj\x91[X\x95\xaa\x95\x0e\
-\x87\xd5\x1f\xc6\xc7\xc6\xc7\xce\xc0iv{\xfd\xd5\x83\x08\
-\xba\xfd\xfc\xf6\x00\xfd\x95\xae\xd5:\xd7\xe5\x9c\x9a\x05\xa0\
-\xa7\x10<z\x11\xe8:e:\x86U\x93\x9a8\xb1$\
-3\xa4\x93\xae\xa5J\xd3\x9de\xffE\x07\xe9:1\x9b\
-\xaaT\xeb,K\xd5\xd9p\xbdML\xb9\x85I\xb3\xc5\
-\xe1\xebJ\xb8\xec\x1dj\xc9_\xafSC\x0f\x8e\x15\xc3\
-\xae\xb6\xe8w\x98\x15\x9c`\x1a\xc1#\xdc\xd9a\xd8\xb2\
-\xb0^\xe42\x04\x8fp\xafN,T7\x0a7\x0bM\
-7Wq\x9f\x98{\xfa\xabo\xed7\xbda\xbc4a\
-a\x03k|\xa1\x01\x86\xc0l\xa1\xce\x8b\xfc\xa6h\xb3\
-J\x0d\x09\x90g\xa5\x94ZpJ\x9bS\xe6\x85\xb2\x1a\
-\x98k\xad\x05\x1dqT\x06G\xaf\xa1Y\xa5\x5cD9\
-\x16}\x1e\xcd\x09\x051l\xa26.\xc1QC\xaea\
-\x8a\xb7\x97b\x98G\xaeE\xc4B\xda\xb0w\x81\xa3f\
-)\x8eYE\xd1\xcaE\x0c\x81eN\x99\xd2\xe2\xf1t\
-o\x0d\x92\x95\xbd\xbf.\x88\xa5/\xdd\x90-\xcfS3\
-\xf0\xd4\xfc\xb8E\x06\xc7\xccD\x1c\xcbE\xf4\x88\xe7\x81\
-*P\xdb\xa2\x06\xd1S\x0c\xc8M\x0aMFt\x83\x98\
-8K\x9c\x81qb\xa8U\x95p\xdc\x0e\xb0\x87\xd9D\
-\x09e\xf9J\xea\x14l\xd9\xce\xc7\x12\xcf7\xca\x00I\
-\x8e.u@\x97\xe2,\x11p-N\xf4\x86\xf7\x13\x0a\
-\xfe\x1c#\x00\xf65\xc1K*\x88\xd489f\xd6\x8d\
-g\xd2\xfcD\x9c\x9b@!P\xdc\xf0\xb8\xfd\xda~\xba\
-m\xef\x88b\xe5\x9a\xc6\xa8a\x9cCL\x85\x00\xe4D\
-CF\x88W\x90\xf0\xc3#\xa4\xa3b\x89\xe8\xbc\xe5\xdd\
-Ia\xaeG\xacILU\xaa\xc4\xcc\x1e)S[\xc8\
-\xd4\x0d\x9cU\x1a\xd70\x83\xe0\x11\xfa\xb2\x92\x8e\x84 \
-\xdcf\x86\xd2\x96G7\xd09\x8b\xe0\xd1E2\xc0\x13\
-\xb2\x1b\xbf\xa1\x14(\x06b\xaf\xadn=\xf9:\x10\x1f\
-\x80\x16\x1b\xa2E\x19\xb9\x05\xee;\xa2\xdd\x03\xe1#\x1b\
-^\xa0\xb7\xd0\xf4\xbe\x83\x8fj\xf9H\xdd\xf1l\x1f\xc9\
-\xc9\xb1~\xf6\x5c>\xf2\x989\x5cV\xec\xee\xb9\xac\xd8\
-\xd9\x00F\x08Xq\xbe\x85\xb5\xc5st9\x90au\
-\x90\x96\xa2a\x86\xae\x03\xd0\xc1NH+\xa6\x0ea\xc0\
-)K\x01\xa9F2B\xefe\xd9\x1dKi\x09_\xa4\
-\xac>\x15m,\xc8\xf0\xb9\xd0T\xcd]\x1b>\xeb\x09\
-\xd0\xa5*\x10\x91\x92\xae\xe9\xabI\xf9\xbeL\x98{\xcd\
-\xad\xf7\xec\xa7\x9b\x87\x7f\xef\xdb[\xf7\xc1M\xe2\x1cv\
-\x85\xd1\xa6[\xe3A$\x14\xc8\x1e\xee\x96*\xbb(9\
-^\xe622H\x13\x18\xa6a\x13n\xcd\xa2\xf4\x9dJ\
-X~\x15\x10\xc1U\xc1\x01]sq4\xf3\xa7\x9c\x1f\
-6\x00`\xa1\xbc\x8a\xe0\x12\xaa\xe3\x90\x109\x91\xeb}\
-3a\xd0\xe6\x82\x11\xff\xba\xcc G\xb6t\xeaj\x8b\
-\x83\xb08\xe2]+\x89Ct\xc7\xc5O\x93\x09\x9d\xc3\
-\xdd5\xe7\x0f\xa8\xb8\x1f\xec\x80Y\xfa\xbd\x1d\xa9\xbf\xf6\
-\xc2\xee=LZG\x96\x0ew6\x9d\xde\x96[\x98;\
-[=\xcfZ\x17\xa0@\xfc\x04\x0a\xd5+\xc8|of\
-\x98Mf\xa3\x07\xfbvo\xdb\xed7#'\xfa\xb8\x22\
-\xf7M\xf0V\xb7]7\x111J\x1dT\xc5U\xacT\
-\x8e\x83L\xd8\xcb\x08\x8a\xb1\xf0\x04[\x9b\xf6\xab\x97\xc5\
-\xf0\x097p\x12z\xe4\xbb\x1aBH\xd0\xe2\xd6\x0a{\
-\xc4\x04\x9e*\x00\x92*#\xd6\x87\xdeU\x19}\x96\xbc\
-#\xfa?\x05\xfep6z\xce\xefw\x05\xbc\xfa\x8c\xb2\
-\xf6%t\x93vy\xceM\x91\x95\x95!\xe8\x87\xce\xe3\
-\x03\xe7\xd5\xbf\xd1\xeb\x93\x82(\x8ck\x1a\xd8Sm\x10\
-fqYk\x11CO\xdb\xb3\x86\xdc\xa7\xc4r\xb1[\
-\xbdVI\xb3Rf\x89\xba\x22r\xf3\x86\xfdf/\xff\
-$\x8f\xb6\xed?\xf7\xdd\xc3\x1c\xee\xfc2\xe41\x0c\x94\
-w\x8a\xe4\xf8a\xa8(/J3\x10\xd8i\xa7\xac\xbe\
-\x85\x03\x05\x87\xeao\xf4\xec_7\xb3NN\x9d\xc0C\
-\xfd\x0d\xad\xdf\x80\xea\xfe\x0bx\xf5\xd1\x09/\xa4\x17\x06\
-\xe1\xbd\xc8N|\x9b>G\xd8\x22\x14y#\x1e\xf5J\
-4\xd8\x19I\xf9\x8dNV\xb9Vq\x9f\x84\x12~\x13\
-\x0a2\x89@\x89D\xb4\x11\xf5\xb0\x1b\x0b\x1a\xd5qV\
-M\x96\xc1\xe1|\xeb<5\x81{\xc8\x9a<-\xb5\xa9\
-I]\x82\x04u\xad\x819\x5c\xa0r\xc8\x99j\xe4\x9e\
-a\x01A\xdb\x86,\x01\xa0\x90\x02\xa3Hk\xa3E\xcc\
-D\xb2\xd2U\xc9]\xb7$\xc9\xa3\x81\x1c\xbcw\xfey\
-\xe1\xb7\xe9\xbd\xfb#\x85\x12jZ\x11\x8a\xe3G~\xac\
-9\xf0\x1a\xf0\xa8\xec\xac|pV\x92\x5c^o\xf7\x80\
-\xb2\xbd\xc3\xdd\x97\x92\xf3\xec\xc9\xe1\xce\x8a\x077\xac,\
-\x9e\xdf\x86b\xf9\xc8\xcc\x00\x9d\x8bp\x1c\x946\xeb4\
-\x9ao\xe8\x89\xbaJ\xc7\x1ae\xc8m\x9a\xc3\xf6g\x14\
-\xf7\x05\x8a\x92ef\xa0n\x06\xa1\x06\xc6y\xea\xc0\xbc\
-\x98\xb9\xd6I\xccX\x1e\xb8g^\x05O\xfe\xf6\xd0^\
-_\xf7~\xcbN[@\xd4\xa7:\xe1\xef\xe9>\x9e\xce\
-\xef8\xbc\xfb\xc6\x9b[\xc0\x11\xe4\xb2\xe21\xfaR<\
-\xbb\xf0g\x05\xde(\xdc-\x97\x04\xb3\x82\x8eA\x5c\xc2\
-\x06]\xdd0\x93\x0d\xbf\x95K\xed\xcco\xd3\x94x\x1b\
-\x99\xde\x95\xd7Z\xa7j\x91\x7f\xb7!\x9f\xe7\xf7v\xb4\
-]\xa7\xb1\xde\xael.3bG&\xe0\xdftx\xf3\
-d\x06\x193\xa5\xfd\xa4\x8fv\xc4\xd6)\xda\xa7\xea\x8c\
-vd\x9d.\x85\x83(\xe8\x9550=\xf4\xce2x\
-\xc1\x9b\x15\xf8P\xcff>\xe8P\x8b\x0c\x08\xc2iG\
-\xf2\x8a\x82\xe4\xc4';\x100p\x83\x97Z\x0b\xa4\x0d\
-J\x0cQ'\x1b/\xde\x84_\x09=\xdd\x7f\xbc\xee\xdc\
-\xd9\xeb\xff\xbc)\xd9k+\xd0\xdfC9\x02\x99\xf7\xaf\
-}\xe7\xf9\x0a\xf0\xf7G\xf8\xe3d2\x00\xc04`\x15\
-\x191F\x97RQ\x98m\xd1k\x82\x0eQ\xfc/\x92\
-T$$\xdd!]\xfd\xb8nq\x864~\x91\xe3\xb6\
-;'<F\x83\x910\xec;M\x04\xd1t\xd9\xbe\xb3\
-WF\xa8\xf8\xb8\xf9}\xb3kJp\xbb\xc1\xce\x99\xcc\
-\xf4\xab*\xe6\x9b\x12\xfbpY\xb4\x9cCC\xe1\x19G\
-\xe5\xa4X\xc8\xbb\x22\xe8`\x1a!\xe2hu\xe6\x1dq\
-T\x19\x8a\xa3\xc9l\x5c\x10JC36\xcfp\xff\x07\
-}\xff\x03&]\xfc\x16\
+\x00\x00\x06\xf0\x00\x00\x1f\x1dx\xda\xcdYmo\xd3V\
+\x14\xfe^\xa9\xff\xc1\xa2\x9a:\x10\x16\x89\xdb\xb4\xa9\xd1\
+>\x0c\xb61$\x98@l\xe3\xc34E7\xf6Mr\
+\xa9\xe3\x1b\xd97ka\x9aT L\xa8*\x1a\xdbR\
+\x0d\xb42\x15\xa9\xe3MH\xabJ\xa5\x15\xad\xfc\xa1\xda\
+\xf9\x0f;v\xfc\xeek;i\xcb\xb4\xfaK{\xed{\
+\xces^\x9e{\xcf9=sJ\xb0^\xf6\xed'{\
+\x82\xbd\xbe9\xe8\xafY\xcf^\xdb\xfb+\xf6\x93]\xfb\
+\xde#\xc1^\xdd\x1a\xdc\x85?\xf6\x85Sg&'\xae\
+^FD\xbfNt\x95.\x9d\x16\xae^'j\x133\
+\xe1\xfb\xc9\x09\x01~\xeaHYl\x1a\xb4\xab\xab\xa2B\
+5j\xc8\xc2\x94\xa4J\xeaL\xe9\xec\xf0\xbd\xbf\x88K\
+\xce\xe3-6\xa8\xce\xc4\x06j\x13\xed\xa6,L_F\
+Z\xb3\xab\x0b\x17(k\x11e\xfa\xb40}\x0d7)\
+\x16\xbe\xba\x08\xbf\x9bH7E\x13\x1b\xa4\x11\xddj\x92\
+[X\x16\xca\xa5\x0e\x83\xd5\x1f&'&'\xce\x805\
+;\xbd\xc1\xea~\x08\xddz~{\x88\xfeJ\xd7l\x9d\
+\xeb2F\xf5\x1c\xd03\x08\x1e5\x0ft\x9d\x1a*\x86\
+U\x9d\xea8\xb6$\x1aH%]S\x16f;\xcb\xde\
+\x8b\x0eRU\xa27e\xa1\xdaY\x16\xcas\xc1z\x9b\
+\xe8b\x0b\x93f\x8b\xc1\xd7\xa5`\xd95j\xc9[\xaf\
+SM\xf5\xcd\x8a`\x97[\xf4;l\xe4X0\x8b\xe0\
+\xe1\xee\xec\x18\xd84\xb1\x9a\x172\x04\x0fw\xafJL\
+T\xd7r7s]7_r\x9eHx\x06\xabo\xad\
+7\xbdQ\xa24eb\x0d+\xac\xd6\x00G`\xa3V\
+gyq\x93\x949\xa9\x8a8\xc8\xd3R\x0a=8\xa3\
+\xccK\x0b\\Y\x0d\xcc\x94VME\x0c\x15\xc1Q\xab\
+hN*\x16Q\x8cE]@\xf3\\A\x06\xd6Q\x1b\
+\x17\xe0\xa8\"\xc71\xf9\xdb\x0b1, \xc7#|!\
+m\xd8[c\xa8Y\x88cN\x92\x94b\x11#`\x99\
+\x97f\x94h>\xdd[\x83\xc3\xca\xda\xebsr\xe9K\
+'e\xbf&x)/R\x15x\xaa^\xd6\"\x8da\
+CG\x0c\x8by\xe4\x88\x9e\x02e \xb6I5\xa2&\
+\xf2?\xf3Hh\x1aD\xd5\x88\x8e\xd3\xb4\x19\xba&\xc0\
+,\xcb\x84\xe1\xb6\x8f<8I\xa4@\x92\xa7\xa2N\xc1\
+\x8f\xedl$\xd1\xb3F\x1a\xe2\xe0j\x92\x87D\xc9?\
+\x1f|\x96E)\xdep\x7f\xb8bu\x95(\x88\xd1 \
+\xa0KDe-\x80Z\x0d\x8c\xf0\x91E\x968\xae\xad\
+ x2\\;\x13n\xcc\x89n66Yiae\
+qt\xb39\xf0\x12\x87\xcf\xe7\x18\xc1\x17C5&\xb8\
+\x94\x1c\xf1\xc6\x89\xde\"\xd9\x97P\xe6\xe5\x01$q\xa8\
+q\xfb\xb5\xf5t\xcb\xda\xe6\xf1\xe4\x9abPM;\x87\
+\x0c\x19\xc8\xc7\xc0-Z\x80\x97s\xd9\x05&$9\xe1\
+G7\xbc\xd0\xda\xc8h\x12]\x16J\x91\xb4\x0b\x95\xc9\
+-\xa4\xab\x1aN+\x8dj\x88\x85>\x96\xcb\xa5$\x13\
+\xfc\x8c\xa8\x8c\xa4-\xeb\xa8\x01\x9ds\x08\x1e\x95'\x03\
+\"!:\xec\x0d\xa4@!\x14ymv\xeb\xf1\xd7\xbe\
+x\x1f4\xdf\x11-j\x90[\x10\xbeC\xfa=\xe0\xd0\
+\xb8\x8e\xe7\xe8\xcdu\xbd\x17\xe0\xc3z>Tw4\xdf\
+\x87r2\xbc\x9f\xb6\xcbC\x1eq\x87\xc3\x8a\x9d]\x87\
+\x15\xdb\xeb\xc0\x08\x0e+\xce;\xe7\xc29\xba\xec\xcb0\
+;HI\xd00E\xd7!h\x7f\xe7\xff\xf0\x04\xe4@\
+;\xfe\x03\x90\xa7\xa4\xab{j\x12\xb1/\x12\xe6\\\xf1\
+\xfd\x9e\xf5t\xe3\xe0\xef=k\xf3>\x84\x89\x7f\x86]\
+1h\xd3\xa9o!\x13rd\x8fvG\x17\x95\x09\x0c\
+/3\x11i\xa4\x09\x0cS\xb0\x0e5C\xde\xf1\x9d8\
+\xb0\xbc\x0a(\x84+C\x00\xba\xfa\xe2x\xeeO\x04?\
+h~\xc0CY\xd5\xd0%T\xc7\x01!22\xd7\xfd\
+fJ\xa3\xcd\x9a\x16\xfd\xba\xc8!\x87\xf6t\xe2j\x8b\
+\x820\x19b]3\x8e\x83w\xc7E\xadI\xa5\xce\xc1\
+\xce\x9a\xfd\x07t\x1b\x0f\xb6\xc1-\x83\xde\xb60X{\
+a\xf5\x1e\xc6\xbd#\x0a\x07\xdb\x1bvo\xd3iJ\xec\
+\xcd\x9e\xeb\xad\x0bP\x1c\x7f\x02E\xfa\x15\xa4\xbf77\
+\xcc\xc5O\xa3\x07{Vo\xcb\xe9\xb5\xc3 z\xb8\xc2\
+\xf0M\xb1V\xb7]\xd7\x11\xd1\x0a\x03T\xc6e,\x95\
+\x8e\x82\x8c\xdb\xc7q\x8a\xd1\xc0\x82\xcd\x0d\xeb\xd5\xcb|\
+\xf8\x84i8\x0e=\x8c]\x15!\xc4i\xef\xab\xb9\xfd\
+q\x0cO\x19\x00\x09\xa51\xebc\xf7\xaa\x0c?\x8b\xdf\
+\x11\x83\x9f\xfcx\xd8\xeb=\xfb\xf7\xbb\x1c^}F\x8d\
+\xf6%t\x93vY\xc6M\x91\x96\x95\"\xe8\x87\xf6\xe3\
+}\xfb\xd5\xbb\xf0\xf5IN\x16F5\x0d\xfd)7\x88\
+a2Qi\x11MM\xfa\xb3\x8a\x9c\xa7\xc0s\x91[\
+\xbdZJ\xb2R4buE\x18\xe6u\xeb\xcdn\xb6\
+%\x8f\xb6\xac?\xf7\x1cc\x0e\xb6\x7f\x19\xd1\x0c\x0de\
+Y\x11\x1f\xbd\x8c\x94\xe5y\xc7\x0c$v2(\xabo\
+\xc1 \xdf\xa8\xc1z\xcf\xfau#\x1d\xe4\x84\x05.\xea\
+oh\xfd\x06T\xf7_\xc0\xab\x8fN\xb8)]\x1b\xa6\
+\xf7\xa2q\xe2\xdb\xa4\x1dA\x93\x94\x17\x8dh\xd6K\xe1\
+Pk,\xe57:i\xe5J\xc9ybJ\xd8M(\
+\xc8\x04\x02%\x12Q\xc6\xd4c\xdc\xa8)T\xc5i5\
+i\x06\x07\xb3\xbd\xf3T\x07\xee!s\xfa\xb4\xd0\xa6:\
+u\x08\xe2\xd7\xb5\x1afp\x81\x8a\x01g\xcaaxF\
+\x05\x04\x8d+29\x80\x02\x0a\x8c#\xad\x8d\x16\xb1\xc1\
+\x93\x95\xacJ\xee:%I\x16\x0dD\xff\xbd\xfd\xcf\x0b\
+oD\xd1\xbb?V*\xa1\xa6\x19\xa28z\xe6G\x9a\
+\x03w\xfc\x10\x96\x9d\xa5\x0f\xce\x0a\x82\xc3\xeb\xad\x1eP\
+\xb6w\xb0\xf3R\xb0\x9f=9\xd8^q\xe1\x06\x95\xc5\
+\xf3\xdbP,\x1f\x9a\x19\xa0s\x11\xccAI\xb7\xce\xa2\
+\x85\x86\x1a\xab\xabT\xacP\x039Ms\xd0\xfe\x8c\x13\
+>_Q\xbc\xcc\xf4\xd5U\x10j`\x9c\xa5\x0e\xdc\x8b\
+\x0d\xc7;\xb1\xf9\xd2\x03\xc7\xe6U\x88\xe4o\x0f\xad~\
+\xdf\xfd-=i\x02Q\x9f\xaa\x84\xbd\xa7\xfbx6\xbb\
+\xe3p\xef\x1bwr\x03&\x88E\xc5c\xf8%\x7fz\
+\xe3\xcd\x0a\xdc\x7f\x038\xe5\x12gV\xd0\xd1\x88CX\
+\xbf\xab\x1be\xb2\xe1\xb5r\x89\x9d\xd9m\x9a\x14m#\
+\x93\xbb\xb2Z\xebD-\xf2n\x0b\xce\xf3\xec\xde\x8e\xb6\
+\xeb4\xd2\xdb\x15\xcde\xc6\xec\xc88\xfc\x9b\x0dn\x9e\
+\xd4 \xa3R\xd8Ozh\xc7l\x9d\xc2}\xb2j\xd0\
+\x8e\xa8\xd2\xa5`\x10\x05\xbd\xb2\x02\xae\x87\xdeY\x84(\
+\xb8\xb3\x02\x0f\xea\xd9\xd4\x07\x1dj\x92!A\x18\xed\x08\
+nQ\x10\x9f\xf8\xa4\x07\x02\x1an\xb0Bo\x81\xb4a\
+\x89\xc1\xebd\xa3\xc5\x1b\xf7+n\xa4\x07\x8f\xfb\xf6\x9d\
+\xdd\xc1\xcf\x1b\x82\xb5\xb6\x02\xfd=\x94#p\xf2\xfe\xb5\
+g?_\x01\xfe\xfe\x08\x7f\x9c\x8c'\x00\xb8\x06\xbc\"\
+\"\xc3\xa0K\x89,L\xb7\xe8UN\x87\xc8\xff\xf7P\
+\"\x13\xe2\xe1\x10\xae~\\7\x99\x81\x14v\x91\xe1\xf6\
+8\xf3\xe9\xa24<\xd6\x83 \x9c\xac[wv\x8b\x08\
+\x15\x8e\xda\xdf7\xb7f8w\x1b\xec\xac\xa4f_e\
+>\xdb\xa4\xc8\x87\xcb\xbc\xe5\x0c\x12r,\x1c\x97\x8f<\
+\x11\xc7E\xcd\xe1\x1c\x82\xc7\xcer\xe5\x98\xd8)\x8d\xc4\
+\xce\xf89\x9c\x93D#s\x95\xef\xb6\xff\x82\xb6\xff\x02\
+\x89\xa8A\x99\
 "
 
 qt_resource_name = b"\
@@ -132,7 +131,7 @@ qt_resource_struct = b"\
 \x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
 \x00\x00\x00\x00\x00\x00\x00\x00\
 \x00\x00\x00\x00\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x96S\x9b{\x92\
+\x00\x00\x01\xa1GH\x1e\xb6\
 "
 
 def qInitResources():
@@ -0,0 +1,263 @@
+from contextlib import contextmanager
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer, QEvent, Signal
+from PySide6.QtWidgets import QStyledItemDelegate, QComboBox, QStyle, QStyleOptionComboBox, QStyleOptionButton, QApplication
+
+TITLE_SOURCES = ["기존 이름", "한국어 이름", "일본어 이름"]
+OPTIONS_ROLE = Qt.UserRole + 1
+
+COL_CHECK, COL_ORIGINAL, COL_SUGGESTED, COL_TAG, COL_TITLE_SOURCE = range(5)
+HEADERS = ["선택", "원래 이름", "제안된 이름", "태그 선택", "제목 소스"]
+
+
+def tag_options(result):
+    """태그 콤보박스 항목: 가져온 태그 목록 + 현재 선택된 태그"""
+    game_data = result.get('game_data') or {}
+    tags = [t for t in game_data.get('tags') or [] if t.strip()] if 'error' not in game_data else []
+    tag = result.get('selected_tag') or '기타'
+    if tag not in tags:
+        tags.append(tag)
+    return tags
+
+
+# 체크 상태: 행마다 1비트, 체크된 개수를 따로 들고 있어서 전체 선택 상태를 O(1) 로 판단
+class CheckSelection:
+    def __init__(self, size=0):
+        self.reset(size)
+
+    def reset(self, size, checked=False):
+        self.size = size
+        self.bits = bytearray(b'\xff' if checked else b'\x00') * ((size + 7) // 8)
+        if checked and size % 8:
+            self.bits[-1] = (1 << (size % 8)) - 1
+        self.count = size if checked else 0
+
+    def extend(self, count):
+        size = self.size + count
+        self.bits.extend(b'\x00' * ((size + 7) // 8 - len(self.bits)))
+        self.size = size
+
+    def is_checked(self, row):
+        return bool(self.bits[row >> 3] & (1 << (row & 7)))
+
+    def set_checked(self, row, checked):
+        """상태가 바뀌었으면 True"""
+        if self.is_checked(row) == checked:
+            return False
+        if checked:
+            self.bits[row >> 3] |= 1 << (row & 7)
+            self.count += 1
+        else:
+            self.bits[row >> 3] &= ~(1 << (row & 7)) & 0xff
+            self.count -= 1
+        return True
+
+    def state(self):
+        if self.count == 0:
+            return Qt.Unchecked
+        if self.count == self.size:
+            return Qt.Checked
+        return Qt.PartiallyChecked
+
+    def selected_rows(self):
+        """체크된 행 번호 목록 (오름차순), 비어 있는 바이트는 건너뜀"""
+        rows = []
+        for byte_index, byte in enumerate(self.bits):
+            if not byte:
+                continue
+            base = byte_index << 3
+            for bit in range(8):
+                if byte & (1 << bit):
+                    rows.append(base + bit)
+        return rows
+
+
+# self.results 를 그대로 보여주는 테이블 모델 (행마다 위젯을 만들지 않음)
+class GameTableModel(QAbstractTableModel):
+    check_changed = Signal(int, bool)
+    value_edited = Signal(int, int, str)  # row, column, text (태그 / 제목 소스 변경)
+
+    def __init__(self, results, parent=None):
+        super().__init__(parent)
+        self.results = results
+        self.selection = CheckSelection(len(results))
+        self.batch_depth = 0
+        self.dirty_rows = set()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.results)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        column = index.column()
+        if column == COL_CHECK:
+            return Qt.ItemIsEnabled | Qt.ItemIsUserCheckable
+        if column in (COL_TAG, COL_TITLE_SOURCE):
+            return Qt.ItemIsEnabled | Qt.ItemIsEditable
+        return Qt.ItemIsEnabled
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        result = self.results[row]
+
+        if column == COL_CHECK:
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if self.selection.is_checked(row) else Qt.Unchecked
+            return None
+
+        if role in (Qt.DisplayRole, Qt.EditRole, Qt.ToolTipRole):
+            if column == COL_ORIGINAL:
+                return result.get('original', '')
+            if column == COL_SUGGESTED:
+                return result.get('suggested', '')
+            if column == COL_TAG:
+                return result.get('selected_tag') or '기타'
+            if column == COL_TITLE_SOURCE:
+                return result.get('selected_title_source') or '기존 이름'
+        elif role == OPTIONS_ROLE:
+            if column == COL_TAG:
+                return tag_options(result)
+            if column == COL_TITLE_SOURCE:
+                return TITLE_SOURCES
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid():
+            return False
+        row, column = index.row(), index.column()
+
+        if column == COL_CHECK and role == Qt.CheckStateRole:
+            checked = Qt.CheckState(value) == Qt.Checked
+            if not self.selection.set_checked(row, checked):
+                return False
+            self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+            self.check_changed.emit(row, checked)
+            return True
+
+        if column in (COL_TAG, COL_TITLE_SOURCE) and role == Qt.EditRole:
+            if value == self.data(index, Qt.EditRole):
+                return False
+            # 실제 반영(제안 이름 재계산)은 MainWindowLogic.update_suggested_name 에서 처리
+            self.value_edited.emit(row, column, value)
+            return True
+        return False
+
+    def reset_rows(self, new_results):
+        """행 전체를 한 번에 교체 (self.results 리스트 객체는 그대로 유지)"""
+        self.beginResetModel()
+        self.results[:] = new_results
+        self.selection.reset(len(self.results))
+        self.dirty_rows.clear()
+        self.endResetModel()
+
+    def append_rows(self, new_results):
+        if not new_results:
+            return
+        first = len(self.results)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_results) - 1)
+        self.results.extend(new_results)
+        self.selection.extend(len(new_results))
+        self.endInsertRows()
+
+    def is_checked(self, row):
+        return self.selection.is_checked(row)
+
+    def selected_rows(self):
+        return self.selection.selected_rows()
+
+    def check_state(self):
+        return self.selection.state()
+
+    def set_all_checked(self, checked):
+        if not self.results:
+            return
+        self.selection.reset(len(self.results), checked)
+        self.dataChanged.emit(self.index(0, COL_CHECK), self.index(len(self.results) - 1, COL_CHECK), [Qt.CheckStateRole])
+
+    def refresh_row(self, row):
+        if self.batch_depth:
+            self.dirty_rows.add(row)
+            return
+        self.dataChanged.emit(self.index(row, COL_ORIGINAL), self.index(row, COL_TITLE_SOURCE))
+
+    @contextmanager
+    def batch_update(self):
+        """여러 행을 고칠 때 행마다 dataChanged 를 보내지 않고 끝에서 한 번만 보냄"""
+        self.batch_depth += 1
+        try:
+            yield
+        finally:
+            self.batch_depth -= 1
+            if not self.batch_depth and self.dirty_rows:
+                first, last = min(self.dirty_rows), max(self.dirty_rows)
+                self.dirty_rows.clear()
+                self.dataChanged.emit(self.index(first, COL_ORIGINAL), self.index(last, COL_TITLE_SOURCE))
+
+
+# 선택 열: 셀 가운데에 체크박스를 그리고, 셀 어디를 눌러도 체크 상태를 바꾼다
+class CheckBoxDelegate(QStyledItemDelegate):
+    def paint(self, painter, option, index):
+        opt = QStyleOptionButton()
+        style = option.widget.style() if option.widget else QApplication.style()
+        indicator = style.subElementRect(QStyle.SE_CheckBoxIndicator, opt, option.widget)
+        opt.rect = indicator.translated(
+            option.rect.x() + (option.rect.width() - indicator.width()) // 2,
+            option.rect.y() + (option.rect.height() - indicator.height()) // 2
+        )
+        checked = index.data(Qt.CheckStateRole) == Qt.Checked
+        opt.state = QStyle.State_Enabled | (QStyle.State_On if checked else QStyle.State_Off)
+        style.drawPrimitive(QStyle.PE_IndicatorCheckBox, opt, painter, option.widget)
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            checked = index.data(Qt.CheckStateRole) == Qt.Checked
+            return model.setData(index, Qt.Unchecked if checked else Qt.Checked, Qt.CheckStateRole)
+        if event.type() == QEvent.MouseButtonDblClick:
+            return True  # 더블클릭으로 두 번 토글되지 않게
+        return False
+
+
+# 태그 / 제목 소스 열: 평소에는 콤보박스 모양만 그리고, 클릭했을 때만 실제 QComboBox 를 만든다
+class ComboBoxDelegate(QStyledItemDelegate):
+    def paint(self, painter, option, index):
+        opt = QStyleOptionComboBox()
+        opt.rect = option.rect.adjusted(1, 1, -1, -1)
+        opt.state = option.state | QStyle.State_Enabled
+        opt.currentText = index.data(Qt.DisplayRole) or ''
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawComplexControl(QStyle.CC_ComboBox, opt, painter, option.widget)
+        style.drawControl(QStyle.CE_ComboBoxLabel, opt, painter, option.widget)
+
+    def createEditor(self, parent, option, index):
+        editor = QComboBox(parent)
+        editor.activated.connect(lambda _, e=editor: self.commit_and_close(e))
+        return editor
+
+    def setEditorData(self, editor, index):
+        editor.blockSignals(True)
+        editor.clear()
+        editor.addItems(index.data(OPTIONS_ROLE) or [])
+        editor.setCurrentText(index.data(Qt.EditRole) or '')
+        editor.blockSignals(False)
+        # 한 번 클릭으로 바로 목록이 열리도록
+        QTimer.singleShot(0, editor.showPopup)
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.currentText(), Qt.EditRole)
+
+    def updateEditorGeometry(self, editor, option, index):
+        editor.setGeometry(option.rect)
+
+    def commit_and_close(self, editor):
+        self.commitData.emit(editor)
+        self.closeEditor.emit(editor, QStyledItemDelegate.NoHint)
@@ -1,11 +1,10 @@
 import requests
-from bs4 import BeautifulSoup
 from playwright.sync_api import sync_playwright
 import logging
 import time
 import re
-from urllib.parse import urljoin
 import argparse
+from dlsite_parser import parse_dlsite_html
 
 # 로그 설정
 logging.basicConfig(
@@ -18,33 +17,22 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# 데이터 파싱 공통 함수
-def parse_game_data(soup, rj_code, url):
+# 데이터 파싱 공통 함수 (dlsite_parser 공용 파서 사용)
+def parse_game_data(html, rj_code, url):
     try:
-        title_elem = soup.select_one('#work_name')
-        if not title_elem:
+        parsed = parse_dlsite_html(html, url)
+        if not parsed['title']:
             logger.error(f"No title found for RJ code {rj_code}")
             return None
-
-        tags_elem = soup.select('div.main_genre a')
-        date_elem = soup.select_one('th:contains("販売日") + td a')
-        thumb_elem = soup.select_one('meta[property="og:image"]') or soup.select_one('img.work_thumb')
-        maker_elem = soup.select_one('span.maker_name a')
-
-        thumbnail_url = ''
-        if thumb_elem:
-            thumbnail_url = thumb_elem.get('content') or thumb_elem.get('src')
-            if thumbnail_url and not thumbnail_url.startswith('http'):
-                thumbnail_url = urljoin(url, thumbnail_url)
-            logger.debug(f"Thumbnail URL: {thumbnail_url}")
+        logger.debug(f"Thumbnail URL: {parsed['thumbnail_url']}")
 
         data = {
             'rj_code': rj_code,
-            'title': title_elem.text.strip(),
-            'tags': [tag.text.strip() for tag in tags_elem if tag.text.strip()][:5],
-            'release_date': date_elem.text.strip() if date_elem else 'N/A',
-            'thumbnail_url': thumbnail_url,
-            'maker': maker_elem.text.strip() if maker_elem else 'N/A',
+            'title': parsed['title'],
+            'tags': parsed['tags'][:5],
+            'release_date': parsed['release_date'] or 'N/A',
+            'thumbnail_url': parsed['thumbnail_url'],
+            'maker': parsed['maker'] or 'N/A',
             'link': url
         }
         logger.info(f"Parsed data for RJ code {rj_code}: {data}")
@@ -74,12 +62,11 @@ def crawl_with_requests(rj_code):
             logger.error(f"HTTP Error: Status code {response.status_code} for RJ code {rj_code}")
             return {"error": f"HTTP {response.status_code}"}
 
-        soup = BeautifulSoup(response.text, 'html.parser')
         if 'age-verification' in response.url or 'adult_check' in response.text.lower():
             logger.warning(f"Adult verification page detected for RJ code {rj_code}")
             return {"error": "Adult verification required"}
 
-        data = parse_game_data(soup, rj_code, url)
+        data = parse_game_data(response.text, rj_code, url)
         if data:
             return data
         return {"error": "Failed to parse data"}
@@ -120,12 +107,11 @@ def crawl_with_requests_cookies(rj_code, custom_cookies=""):
             logger.error(f"HTTP Error: Status code {response.status_code} for RJ code {rj_code}")
             return {"error": f"HTTP {response.status_code}"}
 
-        soup = BeautifulSoup(response.text, 'html.parser')
         if 'age-verification' in response.url or 'adult_check' in response.text.lower():
             logger.warning(f"Adult verification page detected for RJ code {rj_code}")
             return {"error": "Adult verification required"}
 
-        data = parse_game_data(soup, rj_code, url)
+        data = parse_game_data(response.text, rj_code, url)
         if data:
             return data
         return {"error": "Failed to parse data"}
@@ -165,8 +151,7 @@ def crawl_with_playwright(rj_code):
                 return {"error": "HTTP 404"}
 
             content = page.content()
-            soup = BeautifulSoup(content, 'html.parser')
-            data = parse_game_data(soup, rj_code, url)
+            data = parse_game_data(content, rj_code, url)
             browser.close()
             if data:
                 return data
@@ -0,0 +1,196 @@
+import os
+import json
+import time
+import logging
+import hashlib
+import threading
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice, QSize, Qt
+from PySide6.QtGui import QImageReader
+
+INDEX_FILE = "index.json"
+INDEX_FLUSH_INTERVAL = 10  # 인덱스 파일 저장 최소 간격 (초)
+
+
+def fit_size(reader, max_size):
+    """원본 크기를 읽어 max_size 안에 들어가는 축소 크기 반환 (이미 작으면 None)"""
+    size = reader.size()
+    if not size.isValid() or (size.width() <= max_size.width() and size.height() <= max_size.height()):
+        return None
+    return size.scaled(max_size, Qt.KeepAspectRatio)
+
+
+def read_scaled(reader, max_size):
+    # 디코더 단계에서 축소해서 원본 크기 비트맵을 만들지 않는다 (JPEG 는 DCT 단계에서 줄여 읽음)
+    scaled = fit_size(reader, max_size)
+    if scaled is not None:
+        reader.setScaledSize(scaled)
+    image = reader.read()
+    if image.isNull():
+        raise Exception(f"QImageReader: {reader.errorString()}")
+    return image
+
+
+# 표시 크기로 줄인 썸네일만 저장하는 디스크 캐시, 전체 용량을 넘으면 가장 오래 안 쓴 파일부터 삭제
+class ThumbnailDiskCache:
+    def __init__(self, cache_dir="thumbnails", max_bytes=None, max_size=(500, 300), quality=90):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes or int(os.getenv("GAMESORTER_THUMB_CACHE_MB", "200")) * 1024 * 1024
+        self.max_size = QSize(*max_size)
+        self.quality = quality
+        self.lock = threading.Lock()
+        self.index_path = os.path.join(cache_dir, INDEX_FILE)
+        self.entries = {}  # 파일명 → {'bytes', 'used', 'scaled'}
+        self.total_bytes = 0
+        self.dirty = False
+        self.touched = False  # 'used' 만 바뀜: 인덱스를 다시 쓸 이유는 아니고 close() 때 같이 저장
+        self.last_saved = 0.0
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self.load_index()
+        with self.lock:
+            self.evict()
+            self.save_index()
+
+    def key(self, url):
+        return hashlib.sha1(url.encode()).hexdigest() + ".jpg"
+
+    def load_index(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f).get('entries', {})
+        except FileNotFoundError:
+            self.entries = {}
+        except Exception as e:
+            logging.warning(f"[thumb] 인덱스 읽기 실패, 다시 만듦: {e}")
+            self.entries = {}
+
+        # 인덱스에 없는 파일(이전 버전이 저장한 원본 크기 이미지 포함)과 사라진 파일 정리
+        # 저장 도중 종료되어 남은 임시 파일(*.jpg.tmp, index.json.tmp)은 삭제
+        on_disk = {}
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".tmp") and entry.is_file():
+                    try:
+                        os.remove(entry.path)
+                    except OSError as e:
+                        logging.warning(f"[thumb] 임시 파일 삭제 실패: {entry.name}: {e}")
+                elif entry.name.endswith(".jpg") and entry.is_file():
+                    on_disk[entry.name] = entry.stat()
+        for name in list(self.entries):
+            if name not in on_disk:
+                del self.entries[name]
+                self.dirty = True
+        for name, st in on_disk.items():
+            if name not in self.entries:
+                self.entries[name] = {'bytes': st.st_size, 'used': st.st_mtime, 'scaled': False}
+                self.dirty = True
+        self.total_bytes = sum(e['bytes'] for e in self.entries.values())
+        logging.info(f"[thumb] 디스크 캐시 {len(self.entries)}개, {self.total_bytes / 1024 / 1024:.1f} MB")
+
+    def save_index(self):
+        if not self.dirty:
+            return
+        tmp_path = self.index_path + ".tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'entries': self.entries}, f)
+            os.replace(tmp_path, self.index_path)
+            self.dirty = False
+            self.touched = False
+            self.last_saved = time.monotonic()
+        except Exception as e:
+            logging.error(f"[thumb] 인덱스 저장 실패: {e}")
+
+    def evict(self):
+        if self.total_bytes <= self.max_bytes:
+            return
+        removed = 0
+        for name, entry in sorted(self.entries.items(), key=lambda item: item[1]['used']):
+            if self.total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logging.warning(f"[thumb] 삭제 실패: {name}: {e}")
+                continue
+            self.total_bytes -= entry['bytes']
+            del self.entries[name]
+            removed += 1
+        self.dirty = True
+        logging.info(f"[thumb] {removed}개 삭제, 현재 {self.total_bytes / 1024 / 1024:.1f} MB")
+
+    def write(self, name, image):
+        path = os.path.join(self.cache_dir, name)
+        tmp_path = path + ".tmp"
+        if not image.save(tmp_path, "JPG", self.quality):
+            raise Exception(f"thumbnail save failed: {path}")
+        os.replace(tmp_path, path)
+        size = os.path.getsize(path)
+        with self.lock:
+            previous = self.entries.get(name)
+            if previous:
+                self.total_bytes -= previous['bytes']
+            self.entries[name] = {'bytes': size, 'used': time.time(), 'scaled': True}
+            self.total_bytes += size
+            self.dirty = True
+            self.evict()
+            # 인덱스 전체를 매번 다시 쓰지 않고 INDEX_FLUSH_INTERVAL 초마다 (나머지는 close() 에서)
+            if time.monotonic() - self.last_saved >= INDEX_FLUSH_INTERVAL:
+                self.save_index()
+
+    def load(self, url):
+        """캐시된 썸네일을 표시 크기로 읽어 반환, 없거나 깨졌으면 None"""
+        name = self.key(url)
+        with self.lock:
+            entry = self.entries.get(name)
+            if entry is None:
+                return None
+            entry['used'] = time.time()
+            self.touched = True
+            scaled = entry.get('scaled')
+
+        path = os.path.join(self.cache_dir, name)
+        try:
+            image = read_scaled(QImageReader(path), self.max_size)
+        except Exception as e:
+            logging.warning(f"Failed to load cached thumbnail: {path}: {e}")
+            self.remove(name)
+            return None
+
+        if not scaled:
+            # 이전 버전이 저장한 원본 크기 파일은 줄인 크기로 다시 저장
+            try:
+                self.write(name, image)
+            except Exception as e:
+                logging.warning(f"[thumb] 축소 저장 실패: {path}: {e}")
+        return image
+
+    def store(self, url, data):
+        """다운로드한 원본 바이트를 표시 크기로 디코드해서 저장하고 QImage 반환"""
+        buffer = QBuffer()
+        buffer.setData(QByteArray(data))
+        buffer.open(QIODevice.ReadOnly)
+        image = read_scaled(QImageReader(buffer), self.max_size)
+        try:
+            self.write(self.key(url), image)
+        except Exception as e:
+            logging.warning(f"[thumb] 저장 실패: {url}: {e}")
+        return image
+
+    def remove(self, name):
+        with self.lock:
+            entry = self.entries.pop(name, None)
+            if entry:
+                self.total_bytes -= entry['bytes']
+                self.dirty = True
+        try:
+            os.remove(os.path.join(self.cache_dir, name))
+        except OSError:
+            pass
+
+    def close(self):
+        with self.lock:
+            self.dirty = self.dirty or self.touched
+            self.save_index()
@@ -0,0 +1,171 @@
+import os
+import logging
+from collections import OrderedDict, deque
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtGui import QImage, QPixmap
+from http_session import PooledSession
+from thumbnail_cache import ThumbnailDiskCache
+
+THUMBNAIL_SIZE = (500, 300)
+THUMBNAIL_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36",
+    "Referer": "https://www.dlsite.com/",
+    "Accept": "image/webp,image/apng,image/*,*/*;q=0.8"
+}
+
+
+# URL → 표시 크기로 줄인 QPixmap, 가장 오래 안 쓴 것부터 버림
+class PixmapCache:
+    def __init__(self, max_items=None):
+        self.max_items = max_items or int(os.getenv("GAMESORTER_THUMB_MEMORY", "200"))
+        self.items = OrderedDict()
+
+    def get(self, url):
+        pixmap = self.items.get(url)
+        if pixmap is not None:
+            self.items.move_to_end(url)
+        return pixmap
+
+    def put(self, url, pixmap):
+        self.items[url] = pixmap
+        self.items.move_to_end(url)
+        while len(self.items) > self.max_items:
+            self.items.popitem(last=False)
+
+    def __contains__(self, url):
+        return url in self.items
+
+
+class _TaskSignals(QObject):
+    loaded = Signal(str, QImage)
+    failed = Signal(str, str)
+
+
+# 스레드 풀에서 디스크 캐시 확인 → 다운로드 → 디코드/축소까지 처리 (QPixmap 은 UI 스레드에서만 만든다)
+class ThumbnailTask(QRunnable):
+    def __init__(self, url, disk_cache, session, prefetch=False):
+        super().__init__()
+        self.url = url
+        self.disk_cache = disk_cache
+        self.session = session
+        self.prefetch = prefetch
+        self.cancelled = False
+        self.signals = _TaskSignals()
+
+    def run(self):
+        try:
+            if self.cancelled:
+                return
+            image = self.disk_cache.load(self.url)
+
+            if image is None:
+                logging.debug(f"Downloading thumbnail: {self.url}")
+                response = self.session.get(self.url, headers=THUMBNAIL_HEADERS, timeout=10)
+                if response.status_code != 200 or not response.content:
+                    raise Exception(f"HTTP {response.status_code}, content empty?")
+                image = self.disk_cache.store(self.url, response.content)
+
+            if self.cancelled:
+                return
+            self.signals.loaded.emit(self.url, image)
+        except Exception as e:
+            if not self.cancelled:
+                self.signals.failed.emit(self.url, str(e))
+
+
+# GameDataPanel 용 비동기 썸네일 로더: 한 번에 하나의 URL 만 화면에 보여주고, 선택이 바뀌면 이전 요청은 취소
+# 화면에 보이는 행 / 다음 행들의 썸네일은 낮은 우선순위로 미리 불러온다 (스레드 하나는 항상 클릭용으로 남김)
+class ThumbnailLoader(QObject):
+    loaded = Signal(str, QPixmap)
+    failed = Signal(str, str)
+
+    def __init__(self, cache_dir="thumbnails", max_threads=4, parent=None):
+        super().__init__(parent)
+        self.disk_cache = ThumbnailDiskCache(cache_dir, max_size=THUMBNAIL_SIZE)
+        self.memory = PixmapCache()
+        self.session = PooledSession(pool_size=max_threads)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+        self.current_url = None
+        self.tasks = {}  # url → 진행 중인 ThumbnailTask
+        self.prefetch_queue = deque()
+        self.prefetch_active = 0
+        self.prefetch_slots = max(1, max_threads - 1)
+
+    def request(self, url):
+        """메모리 캐시에 있으면 바로 QPixmap 반환, 없으면 백그라운드에서 불러오고 None 반환"""
+        self.current_url = url
+        pixmap = self.memory.get(url)
+        if pixmap is not None:
+            self.cancel_others(url)
+            return pixmap
+
+        self.cancel_others(url)
+        if url not in self.tasks:
+            self.start_task(url, prefetch=False)
+        return None
+
+    def prefetch(self, urls):
+        """새 목록으로 미리 불러오기 대기열 교체 (이미 불러왔거나 불러오는 중인 URL 은 제외)"""
+        self.prefetch_queue = deque(
+            url for url in dict.fromkeys(urls)
+            if url and url not in self.memory and url not in self.tasks
+        )
+        self.pump_prefetch()
+
+    def pump_prefetch(self):
+        while self.prefetch_active < self.prefetch_slots and self.prefetch_queue:
+            url = self.prefetch_queue.popleft()
+            if url in self.memory or url in self.tasks:
+                continue
+            self.prefetch_active += 1
+            self.start_task(url, prefetch=True)
+
+    def start_task(self, url, prefetch):
+        task = ThumbnailTask(url, self.disk_cache, self.session, prefetch=prefetch)
+        task.signals.loaded.connect(self.on_task_loaded)
+        task.signals.failed.connect(self.on_task_failed)
+        self.tasks[url] = task
+        # 클릭 요청이 대기 중인 미리 불러오기보다 먼저 실행되도록 우선순위 차등
+        self.pool.start(task, -1 if prefetch else 1)
+
+    def cancel(self):
+        self.current_url = None
+        self.cancel_others(None)
+
+    def cancel_others(self, keep_url):
+        for url, task in list(self.tasks.items()):
+            if url == keep_url or task.prefetch:
+                continue
+            task.cancelled = True
+            # 아직 시작하지 않은 작업은 큐에서 빼고, 실행 중인 작업은 결과만 버린다
+            self.pool.tryTake(task)
+            del self.tasks[url]
+
+    def finish_task(self, url):
+        task = self.tasks.pop(url, None)
+        if task is not None and task.prefetch:
+            self.prefetch_active -= 1
+            self.pump_prefetch()
+
+    def on_task_loaded(self, url, image):
+        pixmap = QPixmap.fromImage(image)
+        self.memory.put(url, pixmap)
+        self.finish_task(url)
+        if url == self.current_url:
+            self.loaded.emit(url, pixmap)
+
+    def on_task_failed(self, url, message):
+        self.finish_task(url)
+        logging.error(f"Thumbnail load error: {message}, URL: {url}")
+        if url == self.current_url:
+            self.failed.emit(url, message)
+
+    def close(self):
+        self.prefetch_queue.clear()
+        for task in self.tasks.values():
+            task.cancelled = True
+        self.cancel()
+        self.pool.waitForDone(2000)
+        self.disk_cache.close()
+        self.session.close()
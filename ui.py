@@ -1,14 +1,13 @@
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QPushButton, QVBoxLayout, QHBoxLayout,
-    QTableWidget, QCheckBox, QLabel, QHeaderView, QProgressBar,
+    QTableView, QAbstractItemView, QCheckBox, QLabel, QHeaderView, QProgressBar,
     QSplitter, QTextEdit, QSizePolicy, QComboBox, QFormLayout
 )
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap
 import logging
-import requests
-import os
-import hashlib
+from thumbnail_loader import ThumbnailLoader
+from table_model import CheckBoxDelegate, ComboBoxDelegate
+from organizer import ORGANIZE_MODES
 
 logging.basicConfig(filename="gamesort.log", level=logging.DEBUG, format="%(asctime)s %(levelname)s %(message)s")
 
@@ -18,6 +17,9 @@ class GameDataPanel(QWidget):
         
         self.layout = QVBoxLayout()
         self.cache_dir = "thumbnails"
+        self.thumbnail_loader = ThumbnailLoader(self.cache_dir, parent=self)
+        self.thumbnail_loader.loaded.connect(self.on_thumbnail_loaded)
+        self.thumbnail_loader.failed.connect(self.on_thumbnail_failed)
         
         # 썸네일 레이블
         self.thumbnail_label = QLabel()
@@ -67,43 +69,26 @@ class GameDataPanel(QWidget):
         self.setLayout(self.layout)
 
     def load_thumbnail_manually(self, url):
-        try:
-            os.makedirs(self.cache_dir, exist_ok=True)
-            filename = hashlib.sha1(url.encode()).hexdigest() + ".jpg"
-            filepath = os.path.join(self.cache_dir, filename)
+        # 다운로드/디코드는 ThumbnailLoader 의 스레드 풀에서, 여기서는 결과만 표시
+        pixmap = self.thumbnail_loader.request(url)
+        if pixmap is not None:
+            logging.debug(f"Thumbnail served from memory: {url}")
+            self.thumbnail_label.setPixmap(pixmap)
+        else:
+            self.thumbnail_label.clear()
+            self.thumbnail_label.setText("Loading...")
 
-            if os.path.exists(filepath):
-                logging.debug(f"Loading cached thumbnail: {filepath}")
-                pixmap = QPixmap()
-                if pixmap.load(filepath):
-                    self.thumbnail_label.setPixmap(pixmap.scaled(500, 300, Qt.KeepAspectRatio))
-                    logging.debug("Cached thumbnail loaded successfully")
-                    return
-                else:
-                    logging.warning(f"Failed to load cached pixmap: {filepath}")
-                    os.remove(filepath)
+    def prefetch(self, data_list):
+        """곧 보게 될 게임들의 썸네일을 백그라운드에서 미리 불러옴"""
+        urls = [data.get('thumbnail_url') for data in data_list if data and 'error' not in data]
+        self.thumbnail_loader.prefetch([url for url in urls if url])
 
-            logging.debug(f"Downloading thumbnail: {url}")
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/129.0.0.0 Safari/537.36",
-                "Referer": "https://www.dlsite.com/",
-                "Accept": "image/webp,image/apng,image/*,*/*;q=0.8"
-            }
-            response = requests.get(url, headers=headers, timeout=10)
-            if response.status_code == 200 and response.content:
-                pixmap = QPixmap()
-                if pixmap.loadFromData(response.content):
-                    with open(filepath, 'wb') as f:
-                        f.write(response.content)
-                    self.thumbnail_label.setPixmap(pixmap.scaled(300, 300, Qt.KeepAspectRatio))
-                    logging.debug("Thumbnail downloaded and cached successfully")
-                else:
-                    raise Exception("QPixmap loadFromData failed")
-            else:
-                raise Exception(f"HTTP {response.status_code}, content empty?")
-        except Exception as e:
-            logging.error(f"Manual thumbnail load error: {e}, URL: {url}")
-            self.thumbnail_label.setText("Failed to load thumbnail")
+    def on_thumbnail_loaded(self, url, pixmap):
+        self.thumbnail_label.setPixmap(pixmap)
+        logging.debug(f"Thumbnail loaded: {url}")
+
+    def on_thumbnail_failed(self, url, message):
+        self.thumbnail_label.setText("Failed to load thumbnail")
 
     def load_game_data(self, data):
         try:
@@ -116,6 +101,7 @@ class GameDataPanel(QWidget):
                 self.label_maker.setText("")
                 self.label_platform.setText("")
                 self.label_link.setText("")
+                self.thumbnail_loader.cancel()
                 self.thumbnail_label.setText("No Thumbnail")
                 logging.debug("Empty or error data received")
                 return
@@ -167,6 +153,7 @@ class GameDataPanel(QWidget):
             if thumbnail_url:
                 self.load_thumbnail_manually(thumbnail_url)
             else:
+                self.thumbnail_loader.cancel()
                 self.thumbnail_label.clear()
                 self.thumbnail_label.setText("No Thumbnail")
 
@@ -191,6 +178,7 @@ class GameDataPanel(QWidget):
         self.label_maker.setText("")
         self.label_platform.setText("")
         self.label_link.setText("")
+        self.thumbnail_loader.cancel()
         self.thumbnail_label.clear()
         self.thumbnail_label.setText("No Thumbnail")
 
@@ -212,28 +200,44 @@ class MainWindowUI(QMainWindow):
         self.fetch_data_btn = QPushButton("🔄 게임 데이터 로드")
         self.rename_btn = QPushButton("💾 이름 변경")
         self.remove_tag_btn = QPushButton("🧹 태그 제거")
+        self.undo_btn = QPushButton("↩ 되돌리기")
+        self.organize_mode_combo = QComboBox()
+        self.organize_mode_combo.addItems(ORGANIZE_MODES.keys())
+        self.organize_btn = QPushButton("🗂 폴더 정리")
+        self.watch_btn = QPushButton("👀 폴더 감시")
+        self.watch_btn.setCheckable(True)
         button_layout.addWidget(self.select_folder_btn)
         button_layout.addWidget(self.fetch_data_btn)
         button_layout.addWidget(self.rename_btn)
+        button_layout.addWidget(self.undo_btn)
+        button_layout.addWidget(self.organize_mode_combo)
+        button_layout.addWidget(self.organize_btn)
         button_layout.addWidget(self.remove_tag_btn)
+        button_layout.addWidget(self.watch_btn)
         left_layout.addLayout(button_layout)
         
         button_height = 40
         self.select_folder_btn.setFixedHeight(button_height)
         self.fetch_data_btn.setFixedHeight(button_height)
         self.rename_btn.setFixedHeight(button_height)
+        self.undo_btn.setFixedHeight(button_height)
+        self.organize_mode_combo.setFixedHeight(button_height)
+        self.organize_btn.setFixedHeight(button_height)
         self.remove_tag_btn.setFixedHeight(button_height)
+        self.watch_btn.setFixedHeight(button_height)
 
-        self.table = QTableWidget(0, 5)  # 열 수를 4에서 5로 변경
-        self.table.setHorizontalHeaderLabels(["선택", "원래 이름", "제안된 이름", "태그 선택", "제목 소스"])
-        self.table.setSelectionMode(QTableWidget.NoSelection)
-        self.table.setColumnWidth(0, 50)
-        self.table.setColumnWidth(3, 100)
-        self.table.setColumnWidth(4, 120)  # 제목 소스 열 너비
-        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
-        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
-        self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.Fixed)
-        self.table.horizontalHeader().setSectionResizeMode(4, QHeaderView.Fixed)
+        # 모델(GameTableModel)은 MainWindowLogic 에서 연결, 행마다 위젯을 만들지 않고 델리게이트로 그림
+        self.table = QTableView()
+        self.table.setSelectionMode(QAbstractItemView.NoSelection)
+        self.table.setEditTriggers(QAbstractItemView.AllEditTriggers)
+        self.table.setWordWrap(False)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(28)
+        self.check_delegate = CheckBoxDelegate(self.table)
+        self.combo_delegate = ComboBoxDelegate(self.table)
+        self.table.setItemDelegateForColumn(0, self.check_delegate)
+        self.table.setItemDelegateForColumn(3, self.combo_delegate)
+        self.table.setItemDelegateForColumn(4, self.combo_delegate)
         left_layout.addWidget(self.table)
 
         status_layout = QHBoxLayout()
@@ -257,7 +261,10 @@ class MainWindowUI(QMainWindow):
         self.select_folder_btn.setObjectName("select_folder_btn")
         self.fetch_data_btn.setObjectName("fetch_data_btn")
         self.rename_btn.setObjectName("rename_btn")
+        self.undo_btn.setObjectName("undo_btn")
+        self.organize_btn.setObjectName("organize_btn")
         self.remove_tag_btn.setObjectName("remove_tag_btn")
+        self.watch_btn.setObjectName("watch_btn")
         self.log_label.setObjectName("log_label")
         self.status_label.setObjectName("status_label")
 
@@ -267,4 +274,16 @@ class MainWindowUI(QMainWindow):
         splitter.addWidget(left_panel)
         splitter.addWidget(self.game_data_panel)
         splitter.setSizes([800, 400])
-        main_layout.addWidget(splitter)
\ No newline at end of file
+        main_layout.addWidget(splitter)
+
+    def set_table_model(self, model):
+        # 열 너비는 모델이 연결된 뒤에야 헤더 구역이 생기므로 여기서 설정
+        self.table.setModel(model)
+        self.table.setColumnWidth(0, 50)
+        self.table.setColumnWidth(3, 100)
+        self.table.setColumnWidth(4, 120)  # 제목 소스 열 너비
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Fixed)
+        self.table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
+        self.table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
+        self.table.horizontalHeader().setSectionResizeMode(3, QHeaderView.Fixed)
+        self.table.horizontalHeader().setSectionResizeMode(4, QHeaderView.Fixed)
@@ -0,0 +1,117 @@
+import os
+import json
+import queue
+import threading
+import time
+import logging
+
+
+# 크롤링 결과를 모아서 /games 에 배치로 저장하는 백그라운드 업로더
+# 종료 시 보내지 못한 항목은 spool 파일에 남기고 다음 실행 때 다시 보낸다
+class UploadQueue:
+    def __init__(self, send, batch_size=None, flush_interval=None, spool_path=None):
+        self.send = send
+        self.batch_size = max(1, batch_size or int(os.getenv("GAMESORTER_UPLOAD_BATCH", "50")))
+        self.flush_interval = flush_interval or float(os.getenv("GAMESORTER_UPLOAD_INTERVAL", "1.0"))
+        self.spool_path = spool_path or os.getenv("GAMESORTER_UPLOAD_SPOOL", "pending_uploads.json")
+
+        self.queue = queue.Queue()
+        self.failed = []
+        self.sent_count = 0
+        # close() 이후 끝난 전송의 실패분도 spool 에 남기기 위한 잠금 / spool 에 쓴 항목 (close 전에는 None)
+        self.lock = threading.Lock()
+        self.spooled = None
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self._loop, name="UploadQueue", daemon=True)
+
+    def start(self):
+        replay = self._load_spool()
+        for record in replay:
+            self.queue.put(record)
+        if replay:
+            logging.info(f"[upload] 이전 실행에서 남은 {len(replay)}개 항목 재전송")
+        self.thread.start()
+        return self
+
+    def put(self, record):
+        self.queue.put(record)
+
+    def _drain(self, timeout):
+        batch = []
+        deadline = time.monotonic() + timeout
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self.queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _flush(self, batch):
+        if not batch:
+            return
+        try:
+            self.send(batch)
+            self.sent_count += len(batch)
+            logging.info(f"[upload] {len(batch)}개 항목 배치 저장 완료")
+        except Exception as e:
+            logging.error(f"[upload] 배치 저장 실패 ({len(batch)}개): {e}")
+            with self.lock:
+                if self.spooled is None:
+                    self.failed.extend(batch)
+                else:
+                    # close() 가 기다리다 먼저 spool 을 썼으면 실패한 배치를 덧붙여 다시 저장
+                    self.spooled.extend(batch)
+                    self._save_spool(self.spooled)
+
+    def _loop(self):
+        while not self.stop_event.is_set():
+            self._flush(self._drain(self.flush_interval))
+        # 종료 요청 후 큐에 남은 항목 마저 전송
+        while True:
+            batch = self._drain(0.01)
+            if not batch:
+                break
+            self._flush(batch)
+
+    def close(self, timeout=30):
+        """남은 항목을 전송하고, 실패/미전송 항목은 spool 파일에 저장"""
+        self.stop_event.set()
+        if self.thread.is_alive():
+            self.thread.join(timeout)
+
+        with self.lock:
+            unsent = list(self.failed)
+            while True:
+                try:
+                    unsent.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._save_spool(unsent)
+            self.spooled = list(unsent)
+        logging.info(f"[upload] 종료: 전송 {self.sent_count}개, 미전송 {len(unsent)}개")
+        return unsent
+
+    def _load_spool(self):
+        if not os.path.exists(self.spool_path):
+            return []
+        try:
+            with open(self.spool_path, 'r', encoding='utf-8') as f:
+                records = json.load(f)
+            os.remove(self.spool_path)
+            return records if isinstance(records, list) else []
+        except Exception as e:
+            logging.warning(f"[upload] spool 파일 읽기 실패: {self.spool_path}: {e}")
+            return []
+
+    def _save_spool(self, records):
+        if not records:
+            return
+        try:
+            with open(self.spool_path, 'w', encoding='utf-8') as f:
+                json.dump(records, f, ensure_ascii=False)
+            logging.warning(f"[upload] 미전송 {len(records)}개 항목을 {self.spool_path}에 저장")
+        except Exception as e:
+            logging.error(f"[upload] spool 파일 저장 실패: {e}")